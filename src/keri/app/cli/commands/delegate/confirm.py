@@ -5,7 +5,6 @@ keri.kli.commands.delegate module
 
 """
 import argparse
-from ordered_set import OrderedSet as oset
 
 from hio.base import doing
 
@@ -140,7 +139,7 @@ class ConfirmDoer(doing.DoDoer):
 
                         serder = coring.Serder(raw=msg)
                         exn, atc = grouping.multisigInteractExn(ghab=hab, aids=aids, ixn=bytearray(msg))
-                        others = list(oset(hab.smids + (hab.rmids or [])))
+                        others = list(dict.fromkeys(hab.smids + (hab.rmids or [])))
                         others.remove(hab.mhab.pre)
 
                         for recpt in others:  # send notification to other participants as a signalling mechanism
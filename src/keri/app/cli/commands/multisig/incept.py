@@ -8,7 +8,6 @@ keri.kli.commands.multisig module
 import argparse
 import json
 from json import JSONDecodeError
-from ordered_set import OrderedSet as oset
 
 import sys
 from hio.base import doing
@@ -145,7 +144,7 @@ class GroupMultisigIncept(doing.DoDoer):
                                                   smids=ghab.smids,
                                                   rmids=ghab.rmids,
                                                   icp=icp)
-            others = list(oset(smids + (rmids or [])))
+            others = list(dict.fromkeys(smids + (rmids or [])))
 
             others.remove(ghab.mhab.pre)
 
@@ -5,7 +5,6 @@ keri.kli.commands.multisig module
 """
 
 import argparse
-from ordered_set import OrderedSet as oset
 
 from hio import help
 from hio.base import doing
@@ -116,7 +115,7 @@ class GroupMultisigInteract(doing.DoDoer):
         serder = coring.Serder(raw=ixn)
 
         exn, ims = grouping.multisigInteractExn(ghab=ghab, aids=aids, ixn=ixn)
-        others = list(oset(ghab.smids + (ghab.rmids or [])))
+        others = list(dict.fromkeys(ghab.smids + (ghab.rmids or [])))
         others.remove(ghab.mhab.pre)
 
         for recpt in others:  # send notification to other participants as a signalling mechanism
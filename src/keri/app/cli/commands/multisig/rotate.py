@@ -5,7 +5,6 @@ keri.kli.commands.multisig module
 """
 
 import argparse
-from ordered_set import OrderedSet as oset
 
 from hio import help
 from hio.base import doing
@@ -213,7 +212,7 @@ class GroupMultisigRotate(doing.DoDoer):
                                               smids=smids,
                                               rmids=rmids,
                                               rot=bytearray(rot))
-        others = list(oset(smids + (rmids or [])))
+        others = list(dict.fromkeys(smids + (rmids or [])))
 
         others.remove(ghab.mhab.pre)
 
@@ -1233,8 +1233,8 @@ class BaseHab:
 
         indices = []
         for idx, diger in enumerate(kever.digers):
-            pdigs = [coring.Diger(ser=verfer.qb64b, code=diger.code).qb64 for verfer in verfers]
-            if diger.qb64 in pdigs:
+            # verify digests each key with diger's code and compares raw digests
+            if any(diger.verify(ser=verfer.qb64b) for verfer in verfers):
                 indices.append(idx)
 
         if not kever.ntholder.satisfy(indices):
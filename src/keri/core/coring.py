@@ -5,14 +5,17 @@ keri.core.coring module
 """
 import re
 import json
+import binascii
+import math
 from typing import Union
 from collections.abc import Iterable
 
 from dataclasses import dataclass, astuple
-from collections import namedtuple, deque
-from base64 import urlsafe_b64encode as encodeB64
-from base64 import urlsafe_b64decode as decodeB64
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from os import cpu_count  # generateSigners caps stretch workers at cpus too
 from fractions import Fraction
+from functools import lru_cache
 
 import cbor2 as cbor
 import msgpack
@@ -33,8 +36,8 @@ from ..kering import (EmptyMaterialError, RawMaterialError, InvalidCodeError,
                       EmptyListError,
                       ShortageError, UnexpectedCodeError, DeserializeError,
                       UnexpectedCountCodeError, UnexpectedOpCodeError)
-from ..kering import (Versionage, Version, VERRAWSIZE, VERFMT, VERFULLSIZE,
-                      versify, deversify, Rever)
+from ..kering import (Version, VERRAWSIZE, VERFMT, VERFULLSIZE,
+                      versify, deversify, Rever, smell)
 from ..kering import Serials, Serialage, Protos, Protocolage, Ilkage, Ilks
 from ..kering import (ICP_LABELS, DIP_LABELS, ROT_LABELS, DRT_LABELS, IXN_LABELS,
                       KSN_LABELS, RPY_LABELS)
@@ -105,15 +108,18 @@ def sizeify(ked, kind=None, version=Version):
     raw = dumps(ked, kind)
     size = len(raw)
 
-    match = Rever.search(raw)  # Rever's regex takes bytes
-    if not match or match.start() > 12:
+    # old version string is known and already validated by deversify so
+    # locate it with plain find not regex search
+    old = ked["v"].encode("utf-8")
+    fore = raw.find(old, 0, 12 + len(old))
+    if fore < 0:
         raise ValueError("Invalid version string in raw = {}".format(raw))
 
-    fore, back = match.span()  # full version string
+    back = fore + len(old)  # full version string
     # update vs with latest kind version size
     vs = versify(proto=proto, version=vrsn, kind=kind, size=size)
     # replace old version string in raw with new one
-    raw = b'%b%b%b' % (raw[:fore], vs.encode("utf-8"), raw[back:])
+    raw = raw[:fore] + vs.encode("utf-8") + raw[back:]  # concat beats %b format
     if size != len(raw):  # substitution messed up
         raise ValueError("Malformed version string size = {}".format(vs))
     ked["v"] = vs  # update ked
@@ -124,6 +130,35 @@ def sizeify(ked, kind=None, version=Version):
 # Base64 utilities
 BASE64_PAD = b'='
 
+# translation tables between URL safe Base64 chars and standard Base64 chars
+B64_URL_TO_STD = bytes.maketrans(b'-_', b'+/')
+B64_STD_TO_URL = bytes.maketrans(b'+/', b'-_')
+
+
+def encodeB64(b):
+    """
+    Returns URL safe Base64 encode of bytes b as bytes with pad chars if any.
+    Equivalent to base64.urlsafe_b64encode but calls binascii directly so
+    avoids the python glue of base64 module on the hot path of ._infil.
+
+    Parameters:
+        b (bytes | bytearray): bytes to encode
+    """
+    return binascii.b2a_base64(b, newline=False).translate(B64_STD_TO_URL)
+
+
+def decodeB64(b):
+    """
+    Returns URL safe Base64 decode of bytes b as bytes.
+    Equivalent to base64.urlsafe_b64decode but calls binascii directly so
+    avoids the python glue of base64 module on the hot path of ._exfil.
+
+    Parameters:
+        b (bytes | bytearray): URL safe Base64 chars with pad chars if any
+    """
+    return binascii.a2b_base64(b.translate(B64_URL_TO_STD))
+
+
 # Mappings between Base64 Encode Index and Decode Characters
 #  B64ChrByIdx is dict where each key is a B64 index and each value is the B64 char
 #  B64IdxByChr is dict where each key is a B64 char and each value is the B64 index
@@ -135,6 +170,8 @@ B64ChrByIdx[62] = '-'
 B64ChrByIdx[63] = '_'
 # Map char to Base64 index
 B64IdxByChr = {char: index for index, char in B64ChrByIdx.items()}
+# Map byte (int ordinal of char) to Base64 index so bytes need not be decoded
+B64IdxByByte = {ord(char): index for char, index in B64IdxByChr.items()}
 B64_CHARS = tuple(B64ChrByIdx.values())  # tuple of characters in Base64
 
 B64REX = b'^[A-Za-z0-9\-\_]*\Z'
@@ -146,18 +183,15 @@ def intToB64(i, l=1):
     Returns conversion of int i to Base64 str
     l is min number of b64 digits left padded with Base64 0 == "A" char
     """
-    d = deque()  # deque of characters base64
-
-    while l:
-        d.appendleft(B64ChrByIdx[i % 64])
-        i = i // 64
+    if not l:  # zero min length is empty
+        return ""
+    d = ""  # prepend base64 chars with shifts and masks instead of // and %
+    while True:
+        d = B64_CHARS[i & 0x3f] + d
+        i >>= 6
         if not i:
             break
-        # d.appendleft(B64ChrByIdx[i % 64])
-        # i = i // 64
-    for j in range(l - len(d)):  # range(x)  x <= 0 means do not iterate
-        d.appendleft("A")
-    return ("".join(d))
+    return d.rjust(l, "A") if len(d) < l else d
 
 
 def intToB64b(i, l=1):
@@ -174,11 +208,13 @@ def b64ToInt(s):
     """
     if not s:
         raise ValueError("Empty string, conversion undefined.")
-    if hasattr(s, 'decode'):
-        s = s.decode("utf-8")
     i = 0
-    for e, c in enumerate(reversed(s)):
-        i |= B64IdxByChr[c] << (e * 6)  # same as i += B64IdxByChr[c] * (64 ** e)
+    if hasattr(s, 'decode'):  # iterating bytes yields ints so no decode needed
+        for c in s:  # most significant char first
+            i = (i << 6) | B64IdxByByte[c]
+    else:
+        for c in s:  # most significant char first
+            i = (i << 6) | B64IdxByChr[c]  # same as i = i * 64 + B64IdxByChr[c]
     return i
 
 
@@ -250,21 +286,22 @@ def sniff(raw):
     if len(raw) < MINSNIFFSIZE:
         raise ShortageError("Need more bytes.")
 
-    match = Rever.search(raw)  # Rever's regex takes bytes
-    if not match or match.start() > 12:
+    smelled = smell(raw, limit=12)  # fixed offsets first then regex
+    if not smelled:
         raise VersionError("Invalid version string in raw = {}".format(raw))
 
-    proto, major, minor, kind, size = match.group("proto", "major", "minor", "kind", "size")
-    version = Versionage(major=int(major, 16), minor=int(minor, 16))
-    kind = kind.decode("utf-8")
-    proto = proto.decode("utf-8")
+    proto, version, kind, size, _ = smelled
     if kind not in Serials:
         raise DeserializeError("Invalid serialization kind = {}".format(kind))
-    size = int(size, 16)
 
     return proto, kind, version, size
 
 
+# Compact JSON encoder shared by serializations. json.dumps with non default
+# keyword args builds a new JSONEncoder on every call so reuse one instead.
+Jsoner = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+
 def dumps(ked, kind=Serials.json):
     """
     utility function to handle serialization by kind
@@ -277,7 +314,7 @@ def dumps(ked, kind=Serials.json):
        kind (str): serialization kind (JSON, MGPK, CBOR)
     """
     if kind == Serials.json:
-        raw = json.dumps(ked, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        raw = Jsoner.encode(ked).encode("utf-8")
 
     elif kind == Serials.mgpk:
         raw = msgpack.dumps(ked)
@@ -331,7 +368,7 @@ def loads(raw, size=None, kind=Serials.json):
     return ked
 
 
-def generateSigners(salt=None, count=8, transferable=True):
+def generateSigners(salt=None, count=8, transferable=True, workers=4):
     """
     Returns list of Signers for Ed25519
 
@@ -342,24 +379,33 @@ def generateSigners(salt=None, count=8, transferable=True):
         count is number of signers in list
         transferable is boolean true means signer.verfer code is transferable
                                 non-transferable otherwise
+        workers is int max number of concurrent seed stretches. Each Argon2id
+            stretch holds 64 MiB so peak memory is about workers * 64 MiB.
+            Further bounded by count and cpus. 1 means stretch serially.
     """
     if not salt:
         salt = pysodium.randombytes(pysodium.crypto_pwhash_SALTBYTES)
 
-    signers = []
-    for i in range(count):
+    def stretch(i):
         path = f"{i:x}"
         # algorithm default is argon2id
-        seed = pysodium.crypto_pwhash(outlen=32,
+        return pysodium.crypto_pwhash(outlen=32,
                                       passwd=path,
                                       salt=salt,
                                       opslimit=2,  # pysodium.crypto_pwhash_OPSLIMIT_INTERACTIVE,
                                       memlimit=67108864,  # pysodium.crypto_pwhash_MEMLIMIT_INTERACTIVE,
                                       alg=pysodium.crypto_pwhash_ALG_ARGON2ID13)
 
-        signers.append(Signer(raw=seed, transferable=transferable))
+    # each stretch is independent and libsodium releases the GIL via ctypes so
+    # run them concurrently. Each uses memlimit bytes so workers bounds memory
+    workers = min(workers, count, cpu_count() or 1)
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            seeds = list(executor.map(stretch, range(count)))  # keeps order
+    else:
+        seeds = [stretch(i) for i in range(count)]
 
-    return signers
+    return [Signer(raw=seed, transferable=transferable) for seed in seeds]
 
 
 def generatePrivates(salt=None, count=8):
@@ -484,6 +530,8 @@ class SmallVarRawSizeCodex:
 
 
 SmallVrzDex = SmallVarRawSizeCodex()  # Make instance
+SmallVrzLeads = astuple(SmallVrzDex)  # lead chars indexed by lead size
+SmallVrzSet = frozenset(SmallVrzLeads)  # set for fast membership
 
 
 @dataclass(frozen=True)
@@ -505,6 +553,8 @@ class LargeVarRawSizeCodex:
 
 
 LargeVrzDex = LargeVarRawSizeCodex()  # Make instance
+LargeVrzLeads = astuple(LargeVrzDex)  # lead chars indexed by lead size
+LargeVrzSet = frozenset(LargeVrzLeads)  # set for fast membership
 
 
 @dataclass(frozen=True)
@@ -524,6 +574,7 @@ class NonTransCodex:
 
 
 NonTransDex = NonTransCodex()  # Make instance
+NonTransSet = frozenset(NonTransDex)  # set for fast membership
 
 # When add new to DigCodes update Saider.Digests and Serder.Digests class attr
 @dataclass(frozen=True)
@@ -550,6 +601,7 @@ class DigCodex:
 
 
 DigDex = DigCodex()  # Make instance
+DigSet = frozenset(DigDex)  # set for fast membership
 
 
 @dataclass(frozen=True)
@@ -571,6 +623,7 @@ class NumCodex:
 
 
 NumDex = NumCodex()  # Make instance
+NumSet = frozenset(NumDex)  # set for fast membership
 
 
 @dataclass(frozen=True)
@@ -592,6 +645,7 @@ class BextCodex:
 
 
 BexDex = BextCodex()  # Make instance
+BexSet = frozenset(BexDex)  # set for fast membership
 
 
 # namedtuple for size entries in Matter  and Counter derivation code tables
@@ -638,12 +692,15 @@ class Matter:
         _size (int): value for .size property. Number of triplets of bytes
             including lead bytes (quadlets of chars) of variable sized material
             else None.
+        _qb64b (bytes | None): cached value for .qb64b property. None means
+            not yet computed from .raw and .code
         _infil (types.MethodType): creates qb64b from .raw and .code
                                    (fully qualified Base64)
         _exfil (types.MethodType): extracts .code and .raw from qb64b
                                    (fully qualified Base64)
 
     """
+    __slots__ = ("_code", "_size", "_raw", "_qb64b")  # no per instance __dict__
     Codex = MtrDex
     # Hards table maps from bytes Base64 first code char to int of hard size, hs,
     # (stable) of code. The soft size, ss, (unstable) is always 0 for Matter
@@ -653,6 +710,11 @@ class Matter:
     Hards.update({chr(c): 1 for c in range(97, 97 + 26)})
     Hards.update([('0', 2), ('1', 4), ('2', 4), ('3', 4), ('4', 2), ('5', 2),
                   ('6', 2), ('7', 4), ('8', 4), ('9', 4)])
+    # Selects table maps from first code char, either as str char or as int
+    # ordinal element of bytes or bytearray, to int of hard size, hs, so that
+    # ._exfil selects hs with one lookup without decoding the first char.
+    Selects = dict(Hards)
+    Selects.update({ord(c): hs for c, hs in Hards.items()})
     # Sizes table maps from value of hs chars of code to Sizage namedtuple of
     # (hs, ss, fs, ls) where hs is hard size, ss is soft size, and fs is full size
     # and ls is lead size
@@ -714,6 +776,10 @@ class Matter:
     # Bards table maps first code char. converted to binary sextext of hard size,
     # hs. Used for ._bexfil.
     Bards = ({codeB64ToB2(c): hs for c, hs in Hards.items()})
+    # Bodes table maps fixed size code to its binary conversion left shifted
+    # with pad bits, that is the front bytes of .qb2. Used for ._binfil.
+    Bodes = {c: (b64ToInt(c) << (2 * (hs % 4))).to_bytes(sceil(hs * 3 / 4), 'big')
+             for c, (hs, ss, fs, ls) in Sizes.items() if fs}
 
     def __init__(self, raw=None, code=MtrDex.Ed25519N, rize=None,
                  qb64b=None, qb64=None, qb2=None, strip=False):
@@ -749,10 +815,11 @@ class Matter:
             if not isinstance(raw, (bytes, bytearray)):
                 raise TypeError(f"Not a bytes or bytearray, raw={raw}.")
 
-            if code not in self.Sizes:
+            sizage = self.Sizes.get(code)  # one lookup for check and sizes
+            if sizage is None:
                 raise InvalidCodeError("Unsupported code={}.".format(code))
 
-            if code[0] in SmallVrzDex or code[0] in LargeVrzDex:  # dynamic size
+            if code[0] in SmallVrzSet or code[0] in LargeVrzSet:  # dynamic size
                 if rize:  # use rsize to determin length of raw to extract
                     if rize < 0:
                         raise InvalidVarRawSizeError(f"Missing var raw size for "
@@ -760,25 +827,25 @@ class Matter:
                 else:  # use length of provided raw as rize
                     rize = len(raw)
 
-                ls = (3 - (rize % 3)) % 3  # calc actual lead (pad) size
+                ls = -rize % 3  # calc actual lead (pad) size
                 # raw binary size including leader in bytes
                 size = (rize + ls) // 3  # calculate value of size in triplets
-                if code[0] in SmallVrzDex:  # compute code with sizes
+                if code[0] in SmallVrzSet:  # compute code with sizes
                     if size <= (64 ** 2 - 1):
                         hs = 2
-                        s = astuple(SmallVrzDex)[ls]
+                        s = SmallVrzLeads[ls]
                         code = f"{s}{code[1:hs]}"
                     elif size <= (64 ** 4 - 1):  # make big version of code
                         hs = 4
-                        s = astuple(LargeVrzDex)[ls]
+                        s = LargeVrzLeads[ls]
                         code = f"{s}{'A' * (hs - 2)}{code[1]}"
                     else:
                         raise InvalidVarRawSizeError(r"Unsupported raw size for "
                                                      f"code={code}.")
-                elif code[0] in LargeVrzDex:  # compute code with sizes
+                elif code[0] in LargeVrzSet:  # compute code with sizes
                     if size <= (64 ** 4 - 1):
                         hs = 4
-                        s = astuple(LargeVrzDex)[ls]
+                        s = LargeVrzLeads[ls]
                         code = f"{s}{code[1:hs]}"
                     else:
                         raise InvalidVarRawSizeError(r"Unsupported raw size for "
@@ -788,20 +855,26 @@ class Matter:
                                                  f"code={code}.")
 
             else:
-                hs, ss, fs, ls = self.Sizes[code]  # get sizes assumes ls consistent
+                hs, ss, fs, ls = sizage  # get sizes assumes ls consistent
                 if not fs:  # invalid
                     raise InvalidVarSizeError(r"Unsupported variable size "
                                               f"code={code}.")
-                rize = Matter._rawSize(code)
+                rize = ((fs - (hs + ss)) * 3 // 4) - ls  # same as ._rawSize(code)
 
-            raw = raw[:rize]  # copy only exact size from raw stream
-            if len(raw) != rize:  # forbids shorter
+            if len(raw) < rize:  # forbids shorter
                 raise RawMaterialError(f"Not enougth raw bytes for code={code}"
                                        f"expected {rize} got {len(raw)}.")
+            # extract only exact size from raw stream. Exact sized bytes slice
+            # is not copied and memoryview makes bytearray slice a single copy
+            if type(raw) is bytes:
+                raw = raw[:rize]
+            else:
+                raw = bytes(memoryview(raw)[:rize])
 
             self._code = code  # hard value part of code
             self._size = size  # soft value part of code in int
-            self._raw = bytes(raw)  # crypto ops require bytes not bytearray
+            self._raw = raw  # crypto ops require bytes not bytearray
+            self._qb64b = None  # computed lazily from .raw and .code
 
         elif qb64b is not None:
             self._exfil(qb64b)
@@ -900,8 +973,11 @@ class Matter:
         Property qb64b:
         Returns Fully Qualified Base64 Version encoded as bytes
         Assumes self.raw and self.code are correctly populated
+        Caches result of ._infil since .raw and .code are immutable
         """
-        return self._infil()
+        if self._qb64b is None:
+            self._qb64b = self._infil()
+        return self._qb64b
 
     @property
     def qb64(self):
@@ -927,7 +1003,7 @@ class Matter:
         Returns True if identifier does not have non-transferable derivation code,
                 False otherwise
         """
-        return (self.code not in NonTransDex)
+        return (self.code not in NonTransSet)
 
     @property
     def digestive(self):
@@ -936,7 +1012,7 @@ class Matter:
         Returns True if identifier has digest derivation code,
                 False otherwise
         """
-        return (self.code in DigDex)
+        return (self.code in DigSet)
 
 
     @property
@@ -946,7 +1022,7 @@ class Matter:
         Returns True if identifier has prefix derivation code,
                 False otherwise
         """
-        return (self.code in PreDex)
+        return (self.code in PreSet)
 
 
     def _infil(self):
@@ -962,7 +1038,7 @@ class Matter:
         size = self.size  # size if variable length, None otherwise
         raw = self.raw  # bytes or bytearray
 
-        ps = ((3 - (len(raw) % 3)) % 3)  # pad size chars or lead size bytes
+        ps = -len(raw) % 3  # pad size chars or lead size bytes
         hs, ss, fs, ls = self.Sizes[code]
         if not fs:  # variable sized, compute code ss value from .size
             cs = hs + ss  # both hard + soft size
@@ -980,7 +1056,7 @@ class Matter:
                 raise InvalidCodeSizeError(f"Invalid code={both} for converted"
                                            f" raw pad size={ps}.")
             # prepad, convert, and prepend
-            return (both.encode("utf-8") + encodeB64(bytes([0] * ls) + raw))
+            return (both.encode("utf-8") + encodeB64(bytes(ls) + raw))
 
         else:  # fixed size so prepad but lead ls may not be zero
             both = code
@@ -991,7 +1067,7 @@ class Matter:
             # prepad, convert, and replace upfront
             # when fixed and ls != 0 then cs % 4 is zero and ps==ls
             # otherwise  fixed and ls == 0 then cs % 4 == ps
-            return (both.encode("utf-8") + encodeB64(bytes([0] * ps) + raw)[cs % 4:])
+            return (both.encode("utf-8") + encodeB64(bytes(ps) + raw)[cs % 4:])
 
 
     def _binfil(self):
@@ -1018,18 +1094,19 @@ class Matter:
             # both is hard code + converted index
             both = f"{code}{intToB64(size, l=ss)}"
             fs = hs + ss + (size * 4)
-        else:
+            if len(both) != cs:
+                raise InvalidCodeSizeError("Mismatch code size = {} with table = {}."
+                                           .format(cs, len(code)))
+
+            n = sceil(cs * 3 / 4)  # number of b2 bytes to hold b64 code
+            # convert code both to right align b2 int then left shift in pad bits
+            # then convert to bytes
+            bcode = (b64ToInt(both) << (2 * (cs % 4))).to_bytes(n, 'big')
+        else:  # fixed size so binary code is precomputed
             both = code
+            bcode = self.Bodes[code]
 
-        if len(both) != cs:
-            raise InvalidCodeSizeError("Mismatch code size = {} with table = {}."
-                                       .format(cs, len(code)))
-
-        n = sceil(cs * 3 / 4)  # number of b2 bytes to hold b64 code
-        # convert code both to right align b2 int then left shift in pad bits
-        # then convert to bytes
-        bcode = (b64ToInt(both) << (2 * (cs % 4))).to_bytes(n, 'big')
-        full = bcode + bytes([0] * ls) + raw
+        full = bcode + bytes(ls) + raw
         bfs = len(full)
         if bfs % 3 or (bfs * 4 // 3) != fs:  # invalid size
             raise InvalidCodeSizeError(f"Invalid code={both} for raw size={len(raw)}.")
@@ -1047,30 +1124,31 @@ class Matter:
         if not qb64b:  # empty need more bytes
             raise ShortageError("Empty material.")
 
-        first = qb64b[:1]  # extract first char code selector
-        if hasattr(first, "decode"):
-            first = first.decode("utf-8")
-        if first not in self.Hards:
-            if first[0] == '-':
+        hs = self.Selects.get(qb64b[0])  # int for bytes, str char for str
+        if hs is None:  # unsupported first char code selector
+            first = qb64b[:1]
+            if hasattr(first, "decode"):
+                first = first.decode("utf-8")
+            if first == '-':
                 raise UnexpectedCountCodeError("Unexpected count code start"
                                                "while extracing Matter.")
-            elif first[0] == '_':
+            elif first == '_':
                 raise UnexpectedOpCodeError("Unexpected  op code start"
                                             "while extracing Matter.")
             else:
                 raise UnexpectedCodeError(f"Unsupported code start char={first}.")
 
-        hs = self.Hards[first]  # get hard code size
         if len(qb64b) < hs:  # need more bytes
             raise ShortageError(f"Need {hs - len(qb64b)} more characters.")
 
         hard = qb64b[:hs]  # extract hard code
         if hasattr(hard, "decode"):
             hard = hard.decode("utf-8")  # converts bytes/bytearray to str
-        if hard not in self.Sizes:
+        sizage = self.Sizes.get(hard)  # one lookup for both check and sizes
+        if sizage is None:
             raise UnexpectedCodeError(f"Unsupported code ={hard}.")
 
-        hs, ss, fs, ls = self.Sizes[hard]  # assumes hs in both tables match
+        hs, ss, fs, ls = sizage  # assumes hs in both tables match
         cs = hs + ss  # both hs and ss
         size = None
         if not fs:  # compute fs from size chars in ss part of code
@@ -1096,29 +1174,30 @@ class Matter:
             qb64b = qb64b.encode("utf-8")
 
         # check for non-zeroed pad bits or lead bytes
+        # decode whole qb64b in one pass instead of first splicing a prepad
+        # onto a copy of the material. Code chars plus ps pad bit pairs decode
+        # to exactly cb = (3 * cs + ps) // 4 leading bytes of paw
         ps = cs % 4  # code pad size ps = cs mod 4
         pbs = 2 * (ps if ps else ls)  # pad bit size in bits
+        cb = (3 * cs + ps) // 4  # code bytes including pad bits
+        paw = decodeB64(qb64b)  # decode code + lead chars + val
         if ps:  # ps. IF ps THEN not ls (lead) and vice versa OR not ps and not ls
-            base = ps * b'A' + qb64b[cs:]  # replace pre code with prepad chars of zero
-            paw = decodeB64(base)  # decode base to leave prepadded raw
-            pi = (int.from_bytes(paw[:ps], "big"))  # prepad as int
-            if pi & (2 ** pbs - 1 ):  # masked pad bits non-zero
+            pi = paw[cb - 1]  # pad bits are low bits of last code byte
+            pm = (1 << pbs) - 1  # pad bit mask
+            if pi & pm:  # masked pad bits non-zero
                 raise ValueError(f"Non zeroed prepad bits = "
-                                 f"{pi & (2 ** pbs - 1 ):<06b} in {qb64b[cs:cs+1]}.")
-            raw = paw[ps:]  # strip off ps prepad paw bytes
+                                 f"{pi & pm:<06b} in {qb64b[cs:cs+1]}.")
+            raw = paw[cb:]  # strip off code bytes
 
         else:  # not ps. IF not ps THEN may or may not be ls (lead)
-            base = qb64b[cs:]  # strip off code leaving lead chars if any and value
-            # decode lead chars + val leaving lead bytes + raw bytes
-            # then strip off ls lead bytes leaving raw
-            paw = decodeB64(base) # decode base to leave prepadded paw bytes
-            li = int.from_bytes(paw[:ls], "big")  # lead as int
+            # strip off code bytes and then ls lead bytes leaving raw
+            li = int.from_bytes(paw[cb:cb + ls], "big")  # lead as int
             if li:  # pre pad lead bytes must be zero
                 if ls == 1:
                     raise ValueError(f"Non zeroed lead byte = 0x{li:02x}.")
                 else:
                     raise ValueError(f"Non zeroed lead bytes = 0x{li:04x}.")
-            raw = paw[ls:]  # paw is bytes so raw is bytes
+            raw = paw[cb + ls:]  # paw is bytes so raw is bytes
 
         if len(raw) != ((len(qb64b) - cs) * 3 // 4) - ls:  # exact lengths
             raise ConversionError(f"Improperly qualified material = {qb64b}")
@@ -1126,6 +1205,10 @@ class Matter:
         self._code = hard  # hard only
         self._size = size
         self._raw = raw  # ensure bytes so immutable and for crypto ops
+        # decodeB64 also accepts std alphabet '+' and '/' so only cache qb64b
+        # when immutable and without them since then same as ._infil would make
+        self._qb64b = (qb64b if isinstance(qb64b, bytes) and b'+' not in qb64b
+                       and b'/' not in qb64b else None)
 
 
     def _bexfil(self, qb2):
@@ -1189,9 +1272,10 @@ class Matter:
         if ps:  # ps. IF ps THEN not ls (lead) and vice versa OR not ps and not ls
             # convert last byte of code bytes in which are pad bits to int
             pi = (int.from_bytes(qb2[bcs-1:bcs], "big"))
-            if pi & (2 ** pbs - 1 ):  # masked pad bits non-zero
+            pm = (1 << pbs) - 1  # pad bit mask
+            if pi & pm:  # masked pad bits non-zero
                 raise ValueError(f"Non zeroed pad bits = "
-                                 f"{pi & (2 ** pbs - 1 ):>08b} in 0x{pi:02x}.")
+                                 f"{pi & pm:>08b} in 0x{pi:02x}.")
         else:  # not ps. IF not ps THEN may or may not be ls (lead)
             li = int.from_bytes(qb2[bcs:bcs+ls], "big")  # lead as int
             if li:  # pre pad lead bytes must be zero
@@ -1208,6 +1292,7 @@ class Matter:
         self._code = hard
         self._size = size
         self._raw = bytes(raw)  # ensure bytes so immutable and crypto operations
+        self._qb64b = None  # computed lazily from .raw and .code
 
 
 class Seqner(Matter):
@@ -1251,6 +1336,8 @@ class Seqner(Matter):
 
 
     """
+    __slots__ = ()
+    Rize = Matter._rawSize(MtrDex.Salt_128)  # raw size in bytes of sn
 
     def __init__(self, raw=None, qb64b=None, qb64=None, qb2=None,
                  code=MtrDex.Salt_128, sn=None, snh=None, **kwa):
@@ -1276,7 +1363,7 @@ class Seqner(Matter):
                 else:
                     sn = int(snh, 16)
 
-            raw = sn.to_bytes(Matter._rawSize(MtrDex.Salt_128), 'big')
+            raw = sn.to_bytes(self.Rize, 'big')
 
         super(Seqner, self).__init__(raw=raw, qb64b=qb64b, qb64=qb64, qb2=qb2,
                                      code=code, **kwa)
@@ -1354,6 +1441,8 @@ class Number(Matter):
 
     Methods:
     """
+    __slots__ = ()
+    Rizes = {code: Matter._rawSize(code) for code in NumDex}  # raw sizes by code
 
     def __init__(self, raw=None, qb64b=None, qb64=None, qb2=None,
                  code=NumDex.Short, num=None, numh=None, **kwa):
@@ -1417,12 +1506,12 @@ class Number(Matter):
 
             # default to_bytes parameter signed is False. If negative raises
             # OverflowError: can't convert negative int to unsigned
-            raw = num.to_bytes(Matter._rawSize(code), 'big')  # big endian unsigned
+            raw = num.to_bytes(self.Rizes[code], 'big')  # big endian unsigned
 
         super(Number, self).__init__(raw=raw, qb64b=qb64b, qb64=qb64, qb2=qb2,
                                      code=code, **kwa)
 
-        if self.code not in NumDex:
+        if self.code not in NumSet:
             raise ValidationError(f"Invalid code = {self.code} for Number.")
 
 
@@ -1524,6 +1613,7 @@ class Dater(Matter):
     Methods:
 
     """
+    __slots__ = ()
     ToB64 = str.maketrans(":.+", "cdp")  #  translate characters
     FromB64 = str.maketrans("cdp", ":.+")  #  translate characters
 
@@ -1679,7 +1769,7 @@ class Bexter(Matter):
 
         super(Bexter, self).__init__(raw=raw, qb64b=qb64b, qb64=qb64, qb2=qb2,
                                      code=code, **kwa)
-        if self.code not in BexDex:
+        if self.code not in BexSet:
             raise ValidationError("Invalid code = {} for Bexter."
                                   "".format(self.code))
 
@@ -1704,7 +1794,7 @@ class Bexter(Matter):
         Returns the value portion of .qb64 with text code and leader removed
         """
         _, _, _, ls = self.Sizes[self.code]
-        bext = encodeB64(bytes([0] * ls) + self.raw)
+        bext = encodeB64(bytes(ls) + self.raw)
         ws = 0
         if ls == 0 and bext:
             if bext[0] == ord(b'A'):  # strip leading 'A' zero pad
@@ -1962,6 +2052,16 @@ class Verfer(Matter):
         verify: verifies signature
 
     """
+    __slots__ = ("_verify", )
+    # Verifiers table maps code to name of its cipher suite verify method
+    Verifiers = {
+        MtrDex.Ed25519N: "_ed25519",
+        MtrDex.Ed25519: "_ed25519",
+        MtrDex.ECDSA_256r1N: "_secp256r1",
+        MtrDex.ECDSA_256r1: "_secp256r1",
+        MtrDex.ECDSA_256k1N: "_secp256k1",
+        MtrDex.ECDSA_256k1: "_secp256k1",
+    }
 
     def __init__(self, **kwa):
         """
@@ -1970,14 +2070,9 @@ class Verfer(Matter):
         """
         super(Verfer, self).__init__(**kwa)
 
-        if self.code in [MtrDex.Ed25519N, MtrDex.Ed25519]:
-            self._verify = self._ed25519
-        elif self.code in [MtrDex.ECDSA_256r1N, MtrDex.ECDSA_256r1]:
-            self._verify = self._secp256r1
-        elif self.code in [MtrDex.ECDSA_256k1N, MtrDex.ECDSA_256k1]:
-            self._verify = self._secp256k1
-        else:
+        if self.code not in self.Verifiers:
             raise ValueError("Unsupported code = {} for verifier.".format(self.code))
+        self._verify = getattr(self, self.Verifiers[self.code])
 
     def verify(self, sig, ser):
         """
@@ -2095,6 +2190,7 @@ class Cigar(Matter):
         ._exfil is method to extract .code and .raw from fully qualified Base64
 
     """
+    __slots__ = ("_verfer", )
 
     def __init__(self, verfer=None, **kwa):
         """
@@ -2119,6 +2215,15 @@ class Cigar(Matter):
         self._verfer = verfer
 
 
+# namedtuple for cipher suite entries in Signer seed code table
+# sign is the str name of Signer signing method
+# derive is the str name of Signer key-pair derivation method
+# seedsize is the int number of bytes of random seed when generated
+# trans is the str Verfer code of transferable public key
+# ntrans is the str Verfer code of non-transferable public key
+Suitage = namedtuple("Suitage", "sign derive seedsize trans ntrans")
+
+
 class Signer(Matter):
     """
     Signer is Matter subclass with method to create signature of serialization
@@ -2163,6 +2268,25 @@ class Signer(Matter):
         sign: create signature
 
     """
+    __slots__ = ("_sign", "_sigkey", "_verfer", "_transferable")
+    # Suites table maps seed code to its cipher suite
+    Suites = {
+        MtrDex.Ed25519_Seed: Suitage(sign="_ed25519",
+                                     derive="_derive_ed25519",
+                                     seedsize=pysodium.crypto_sign_SEEDBYTES,
+                                     trans=MtrDex.Ed25519,
+                                     ntrans=MtrDex.Ed25519N),
+        MtrDex.ECDSA_256r1_Seed: Suitage(sign="_secp256r1",
+                                         derive="_derive_secp256r1",
+                                         seedsize=ECDSA_256r1_SEEDBYTES,
+                                         trans=MtrDex.ECDSA_256r1,
+                                         ntrans=MtrDex.ECDSA_256r1N),
+        MtrDex.ECDSA_256k1_Seed: Suitage(sign="_secp256k1",
+                                         derive="_derive_secp256k1",
+                                         seedsize=ECDSA_256k1_SEEDBYTES,
+                                         trans=MtrDex.ECDSA_256k1,
+                                         ntrans=MtrDex.ECDSA_256k1N),
+    }
 
     def __init__(self, raw=None, code=MtrDex.Ed25519_Seed, transferable=True, **kwa):
         """
@@ -2178,53 +2302,73 @@ class Signer(Matter):
         try:
             super(Signer, self).__init__(raw=raw, code=code, **kwa)
         except EmptyMaterialError as ex:
-            if code == MtrDex.Ed25519_Seed:
-                raw = pysodium.randombytes(pysodium.crypto_sign_SEEDBYTES)
-                super(Signer, self).__init__(raw=raw, code=code, **kwa)
-            elif code == MtrDex.ECDSA_256r1_Seed:
-                raw = pysodium.randombytes(ECDSA_256r1_SEEDBYTES)
-                super(Signer, self).__init__(raw=bytes(raw), code=code, **kwa)
-            elif code == MtrDex.ECDSA_256k1_Seed:
-                raw = pysodium.randombytes(ECDSA_256k1_SEEDBYTES)
-                super(Signer, self).__init__(raw=bytes(raw), code=code, **kwa)
-
-            else:
+            if code not in self.Suites:
                 raise ValueError("Unsupported signer code = {}.".format(code))
+            raw = pysodium.randombytes(self.Suites[code].seedsize)
+            super(Signer, self).__init__(raw=bytes(raw), code=code, **kwa)
 
-        if self.code == MtrDex.Ed25519_Seed:
-            self._sign = self._ed25519
-            verkey, sigkey = pysodium.crypto_sign_seed_keypair(self.raw)
-            verfer = Verfer(raw=verkey,
-                            code=MtrDex.Ed25519 if transferable
-                            else MtrDex.Ed25519N)
-        elif self.code == MtrDex.ECDSA_256r1_Seed:
-            self._sign = self._secp256r1
-            d = int.from_bytes(self.raw, byteorder="big")
-            sigkey = ec.derive_private_key(d, ec.SECP256R1())
-            verkey = sigkey.public_key().public_bytes(encoding=Encoding.X962, format=PublicFormat.CompressedPoint)
-            verfer = Verfer(raw=verkey,
-                            code=MtrDex.ECDSA_256r1 if transferable
-                            else MtrDex.ECDSA_256r1N)
-        elif self.code == MtrDex.ECDSA_256k1_Seed:
-            self._sign = self._secp256k1
-            d = int.from_bytes(self.raw, byteorder="big")
-            sigkey = ec.derive_private_key(d, ec.SECP256K1())
-            verkey = sigkey.public_key().public_bytes(encoding=Encoding.X962, format=PublicFormat.CompressedPoint)
-            verfer = Verfer(raw=verkey,
-                            code=MtrDex.ECDSA_256k1 if transferable
-                            else MtrDex.ECDSA_256k1N)
-        else:
+        if self.code not in self.Suites:
             raise ValueError("Unsupported signer code = {}.".format(self.code))
+        self._sign = getattr(self, self.Suites[self.code].sign)
 
-        self._verfer = verfer
+        self._transferable = transferable
+        self._sigkey = None  # derived lazily with ._verfer on first use
+        self._verfer = None
+
+    def _derive(self):
+        """
+        Derive key-pair from seed .raw for .code cipher suite and assign
+        derived signing key to ._sigkey and Verfer of public key to ._verfer
+        """
+        suite = self.Suites[self.code]  # .code checked in .__init__
+        sigkey, verkey = getattr(self, suite.derive)(seed=self.raw)
+        self._sigkey = sigkey  # keep derived signing key so not rederived per sign
+        self._verfer = Verfer(raw=verkey,
+                              code=suite.trans if self._transferable
+                              else suite.ntrans)
+
+    @staticmethod
+    def _derive_ed25519(seed):
+        """
+        Returns tuple (sigkey, verkey) of Ed25519 key-pair derived from seed
+        where sigkey is 64 bytes of seed + public key and verkey is public key
+        """
+        verkey, sigkey = pysodium.crypto_sign_seed_keypair(seed)
+        return (sigkey, verkey)
+
+    @staticmethod
+    def _derive_secp256r1(seed):
+        """
+        Returns tuple (sigkey, verkey) of ECDSA secp256r1 key-pair derived from
+        seed where sigkey is private key instance and verkey is compressed
+        public key bytes
+        """
+        d = int.from_bytes(seed, byteorder="big")
+        sigkey = ec.derive_private_key(d, ec.SECP256R1())
+        verkey = sigkey.public_key().public_bytes(encoding=Encoding.X962, format=PublicFormat.CompressedPoint)
+        return (sigkey, verkey)
+
+    @staticmethod
+    def _derive_secp256k1(seed):
+        """
+        Returns tuple (sigkey, verkey) of ECDSA secp256k1 key-pair derived from
+        seed where sigkey is private key instance and verkey is compressed
+        public key bytes
+        """
+        d = int.from_bytes(seed, byteorder="big")
+        sigkey = ec.derive_private_key(d, ec.SECP256K1())
+        verkey = sigkey.public_key().public_bytes(encoding=Encoding.X962, format=PublicFormat.CompressedPoint)
+        return (sigkey, verkey)
 
     @property
     def verfer(self):
         """
         Property verfer:
         Returns Verfer instance
-        Assumes ._verfer is correctly assigned
+        Derives key-pair from seed on first access
         """
+        if self._verfer is None:
+            self._derive()
         return self._verfer
 
     def sign(self, ser, index=None, only=False, ondex=None, **kwa):
@@ -2245,8 +2389,10 @@ class Signer(Matter):
             ondex (int | None): other index offset into list such as prior next
 
         """
+        if self._sigkey is None:
+            self._derive()
         return (self._sign(ser=ser,
-                           seed=self.raw,
+                           sigkey=self._sigkey,
                            verfer=self.verfer,
                            index=index,
                            only=only,
@@ -2254,7 +2400,7 @@ class Signer(Matter):
                            **kwa))
 
     @staticmethod
-    def _ed25519(ser, seed, verfer, index, only=False, ondex=None, **kwa):
+    def _ed25519(ser, sigkey, verfer, index, only=False, ondex=None, **kwa):
         """
         Returns signature as either Cigar or Siger instance as appropriate for
         Ed25519 digital signatures given index and ondex values
@@ -2270,7 +2416,9 @@ class Signer(Matter):
 
         Parameters:
             ser (bytes): serialization to be signed
-            seed (bytes):  raw binary seed (private key)
+            sigkey (bytes | EllipticCurvePrivateKey): signing key derived from
+                seed (private key). Ed25519 is 64 byte seed + public key.
+                ECDSA is private key instance derived from seed.
             verfer (Verfer): instance. verfer.raw is public key
             index (int |None): main index offset into list such as current signing
                 None means return non-indexed Cigar
@@ -2280,8 +2428,8 @@ class Signer(Matter):
                           False means both index lists (default), ondex used
             ondex (int | None): other index offset into list such as prior next
         """
-        # compute raw signature sig using seed on serialization ser
-        sig = pysodium.crypto_sign_detached(ser, seed + verfer.raw)
+        # compute raw signature sig using sigkey on serialization ser
+        sig = pysodium.crypto_sign_detached(ser, sigkey)
 
         if index is None:  # Must be Cigar i.e. non-indexed signature
             return Cigar(raw=sig, code=MtrDex.Ed25519_Sig, verfer=verfer)
@@ -2308,7 +2456,7 @@ class Signer(Matter):
                          verfer=verfer,)
 
     @staticmethod
-    def _secp256r1(ser, seed, verfer, index, only=False, ondex=None, **kwa):
+    def _secp256r1(ser, sigkey, verfer, index, only=False, ondex=None, **kwa):
         """
         Returns signature as either Cigar or Siger instance as appropriate for
         Ed25519 digital signatures given index and ondex values
@@ -2324,7 +2472,9 @@ class Signer(Matter):
 
         Parameters:
             ser (bytes): serialization to be signed
-            seed (bytes):  raw binary seed (private key)
+            sigkey (bytes | EllipticCurvePrivateKey): signing key derived from
+                seed (private key). Ed25519 is 64 byte seed + public key.
+                ECDSA is private key instance derived from seed.
             verfer (Verfer): instance. verfer.raw is public key
             index (int |None): main index offset into list such as current signing
                 None means return non-indexed Cigar
@@ -2334,9 +2484,7 @@ class Signer(Matter):
                           False means both index lists (default), ondex used
             ondex (int | None): other index offset into list such as prior next
         """
-        # compute raw signature sig using seed on serialization ser
-        d = int.from_bytes(seed, byteorder="big")
-        sigkey = ec.derive_private_key(d, ec.SECP256R1())
+        # compute raw signature sig using sigkey on serialization ser
         der = sigkey.sign(ser, ec.ECDSA(hashes.SHA256()))
         (r, s) = utils.decode_dss_signature(der)
         sig = bytearray(r.to_bytes(32, "big"))
@@ -2367,7 +2515,7 @@ class Signer(Matter):
                          verfer=verfer,)
 
     @staticmethod
-    def _secp256k1(ser, seed, verfer, index, only=False, ondex=None, **kwa):
+    def _secp256k1(ser, sigkey, verfer, index, only=False, ondex=None, **kwa):
         """
         Returns signature as either Cigar or Siger instance as appropriate for
         secp256k1 digital signatures given index and ondex values
@@ -2383,7 +2531,9 @@ class Signer(Matter):
 
         Parameters:
             ser (bytes): serialization to be signed
-            seed (bytes):  raw binary seed (private key)
+            sigkey (bytes | EllipticCurvePrivateKey): signing key derived from
+                seed (private key). Ed25519 is 64 byte seed + public key.
+                ECDSA is private key instance derived from seed.
             verfer (Verfer): instance. verfer.raw is public key
             index (int |None): main index offset into list such as current signing
                 None means return non-indexed Cigar
@@ -2393,9 +2543,7 @@ class Signer(Matter):
                           False means both index lists (default), ondex used
             ondex (int | None): other index offset into list such as prior next
         """
-        # compute raw signature sig using seed on serialization ser
-        d = int.from_bytes(seed, byteorder="big")
-        sigkey = ec.derive_private_key(d, ec.SECP256K1())
+        # compute raw signature sig using sigkey on serialization ser
         der = sigkey.sign(ser, ec.ECDSA(hashes.SHA256()))
         (r, s) = utils.decode_dss_signature(der)
         sig = bytearray(r.to_bytes(32, "big"))
@@ -2503,6 +2651,14 @@ class Salter(Matter):
 
     """
     Tier = Tiers.low
+    # Stretches table maps security tier to argon2id (opslimit, memlimit).
+    # libsodium allocates and wipes the memlimit arena inside each call so
+    # there is no arena to reuse across stretches from Python.
+    Stretches = {
+        Tiers.low: (2, 67108864),  # pysodium.crypto_pwhash_*_INTERACTIVE
+        Tiers.med: (3, 268435456),  # pysodium.crypto_pwhash_*_MODERATE
+        Tiers.high: (4, 1073741824),  # pysodium.crypto_pwhash_*_SENSITIVE
+    }
 
     def __init__(self, raw=None, code=MtrDex.Salt_128, tier=None, **kwa):
         """
@@ -2551,17 +2707,9 @@ class Salter(Matter):
             opslimit = 1  # pysodium.crypto_pwhash_OPSLIMIT_MIN
             memlimit = 8192  # pysodium.crypto_pwhash_MEMLIMIT_MIN
         else:
-            if tier == Tiers.low:
-                opslimit = 2  # pysodium.crypto_pwhash_OPSLIMIT_INTERACTIVE
-                memlimit = 67108864  # pysodium.crypto_pwhash_MEMLIMIT_INTERACTIVE
-            elif tier == Tiers.med:
-                opslimit = 3  # pysodium.crypto_pwhash_OPSLIMIT_MODERATE
-                memlimit = 268435456  # pysodium.crypto_pwhash_MEMLIMIT_MODERATE
-            elif tier == Tiers.high:
-                opslimit = 4  # pysodium.crypto_pwhash_OPSLIMIT_SENSITIVE
-                memlimit = 1073741824  # pysodium.crypto_pwhash_MEMLIMIT_SENSITIVE
-            else:
+            if tier not in self.Stretches:
                 raise ValueError("Unsupported security tier = {}.".format(tier))
+            opslimit, memlimit = self.Stretches[tier]
 
         # stretch algorithm is argon2id
         seed = pysodium.crypto_pwhash(outlen=size,
@@ -2898,10 +3046,22 @@ class Diger(Matter):
 
 
     """
+    __slots__ = ()
+
+    # Digests table maps digest code to function that returns raw digest of ser
+    # Blake3 is the default code and uses the SIMD accelerated blake3 package.
+    # SHA2 and SHA3 use hashlib's OpenSSL backend with SHA-NI when available.
+    Digests = {
+        MtrDex.Blake3_256: lambda ser: blake3.blake3(ser).digest(),
+        MtrDex.Blake2b_256: lambda ser: hashlib.blake2b(ser, digest_size=32).digest(),
+        MtrDex.Blake2s_256: lambda ser: hashlib.blake2s(ser, digest_size=32).digest(),
+        MtrDex.SHA3_256: lambda ser: hashlib.sha3_256(ser).digest(),
+        MtrDex.SHA2_256: lambda ser: hashlib.sha256(ser).digest(),
+    }
 
     def __init__(self, raw=None, ser=None, code=MtrDex.Blake3_256, **kwa):
         """
-        Assign digest verification function to ._verify
+        Validate that .code is a supported digest code in .Digests
 
         See Matter for inherited parameters
 
@@ -2923,44 +3083,25 @@ class Diger(Matter):
         except EmptyMaterialError as ex:
             if not ser:
                 raise ex
-            if code == MtrDex.Blake3_256:
-                dig = blake3.blake3(ser).digest()
-            elif code == MtrDex.Blake2b_256:
-                dig = hashlib.blake2b(ser, digest_size=32).digest()
-            elif code == MtrDex.Blake2s_256:
-                dig = hashlib.blake2s(ser, digest_size=32).digest()
-            elif code == MtrDex.SHA3_256:
-                dig = hashlib.sha3_256(ser).digest()
-            elif code == MtrDex.SHA2_256:
-                dig = hashlib.sha256(ser).digest()
-            else:
-                raise InvalidValueError("Unsupported code={code} for diger.")
+            if code not in self.Digests:
+                raise InvalidValueError(f"Unsupported code={code} for diger.")
+            dig = self.Digests[code](ser)
 
             super(Diger, self).__init__(raw=dig, code=code, **kwa)
 
-        if self.code == MtrDex.Blake3_256:
-            self._verify = self._blake3_256
-        elif self.code == MtrDex.Blake2b_256:
-            self._verify = self._blake2b_256
-        elif self.code == MtrDex.Blake2s_256:
-            self._verify = self._blake2s_256
-        elif self.code == MtrDex.SHA3_256:
-            self._verify = self._sha3_256
-        elif self.code == MtrDex.SHA2_256:
-            self._verify = self._sha2_256
-        else:
-            raise InvalidValueError("Unsupported code={self.code} for diger.")
+        if self.code not in self.Digests:
+            raise InvalidValueError(f"Unsupported code={self.code} for diger.")
 
     def verify(self, ser):
         """
         Returns True if raw digest of ser bytes (serialization) matches .raw
-        using .raw as reference digest for ._verify digest algorithm determined
-        by .code
+        using .raw as reference digest for the .Digests digest algorithm
+        determined by .code
 
         Parameters:
             ser (bytes): serialization to be digested and compared to .ser
         """
-        return (self._verify(ser=ser, raw=self.raw))
+        return (self.Digests[self.code](ser) == self.raw)
 
     def compare(self, ser, dig=None, diger=None):
         """
@@ -2990,6 +3131,11 @@ class Diger(Matter):
             if dig == self.qb64b:  # matching
                 return True
 
+            # hard code size is fixed by first char so same leading code chars
+            # means same code. Not matching with same code so skip extraction
+            if dig.startswith(self.code.encode("utf-8")):
+                return False
+
             diger = Diger(qb64b=dig)  # extract code
 
         elif diger is not None:
@@ -3007,66 +3153,6 @@ class Diger(Matter):
 
         return (False)
 
-    @staticmethod
-    def _blake3_256(ser, raw):
-        """
-        Returns True if verified False otherwise
-        Verifiy blake3_256 digest of ser matches raw
-
-        Parameters:
-            ser is bytes serialization
-            dig is bytes reference digest
-        """
-        return (blake3.blake3(ser).digest() == raw)
-
-    @staticmethod
-    def _blake2b_256(ser, raw):
-        """
-        Returns True if verified False otherwise
-        Verifiy blake2b_256 digest of ser matches raw
-
-        Parameters:
-            ser is bytes serialization
-            dig is bytes reference digest
-        """
-        return (hashlib.blake2b(ser, digest_size=32).digest() == raw)
-
-    @staticmethod
-    def _blake2s_256(ser, raw):
-        """
-        Returns True if verified False otherwise
-        Verifiy blake2s_256 digest of ser matches raw
-
-        Parameters:
-            ser is bytes serialization
-            dig is bytes reference digest
-        """
-        return (hashlib.blake2s(ser, digest_size=32).digest() == raw)
-
-    @staticmethod
-    def _sha3_256(ser, raw):
-        """
-        Returns True if verified False otherwise
-        Verifiy blake2s_256 digest of ser matches raw
-
-        Parameters:
-            ser is bytes serialization
-            dig is bytes reference digest
-        """
-        return (hashlib.sha3_256(ser).digest() == raw)
-
-    @staticmethod
-    def _sha2_256(ser, raw):
-        """
-        Returns True if verified False otherwise
-        Verifiy blake2s_256 digest of ser matches raw
-
-        Parameters:
-            ser is bytes serialization
-            dig is bytes reference digest
-        """
-        return (hashlib.sha256(ser).digest() == raw)
-
 
 
 @dataclass(frozen=True)
@@ -3098,6 +3184,7 @@ class PreCodex:
 
 
 PreDex = PreCodex()  # Make instance
+PreSet = frozenset(PreDex)  # set for fast membership
 
 
 class Prefixer(Matter):
@@ -3130,7 +3217,27 @@ class Prefixer(Matter):
         ._infil is method to compute fully qualified Base64 from .raw and .code
         ._exfil is method to extract .code and .raw from fully qualified Base64
     """
+    __slots__ = ("_derive", "_verify")
     Dummy = "#"  # dummy spaceholder char for pre. Must not be a valid Base64 char
+    # Derivers and Verifiers tables map code to name of its derive or verify method
+    Derivers = {
+        MtrDex.Ed25519N: "_derive_non_transferable",
+        MtrDex.ECDSA_256r1N: "_derive_non_transferable",
+        MtrDex.ECDSA_256k1N: "_derive_non_transferable",
+        MtrDex.Ed25519: "_derive_transferable",
+        MtrDex.ECDSA_256r1: "_derive_transferable",
+        MtrDex.ECDSA_256k1: "_derive_transferable",
+        MtrDex.Blake3_256: "_derive_blake3_256",
+    }
+    Verifiers = {
+        MtrDex.Ed25519N: "_verify_non_transferable",
+        MtrDex.ECDSA_256r1N: "_verify_non_transferable",
+        MtrDex.ECDSA_256k1N: "_verify_non_transferable",
+        MtrDex.Ed25519: "_verify_transferable",
+        MtrDex.ECDSA_256r1: "_verify_transferable",
+        MtrDex.ECDSA_256k1: "_verify_transferable",
+        MtrDex.Blake3_256: "_verify_blake3_256",
+    }
 
     def __init__(self, raw=None, code=None, ked=None, allows=None, **kwa):
         """
@@ -3167,27 +3274,17 @@ class Prefixer(Matter):
             if allows is not None and code not in allows:
                 raise ValueError("Unallowed code={} for prefixer.".format(code))
 
-            if code in [MtrDex.Ed25519N, MtrDex.ECDSA_256r1N, MtrDex.ECDSA_256k1N]:
-                self._derive = self._derive_non_transferable
-            elif code in [MtrDex.Ed25519, MtrDex.ECDSA_256r1, MtrDex.ECDSA_256k1]:
-                self._derive = self._derive_transferable
-            elif code == MtrDex.Blake3_256:
-                self._derive = self._derive_blake3_256
-            else:
+            if code not in self.Derivers:
                 raise ValueError("Unsupported code = {} for prefixer.".format(code))
+            self._derive = getattr(self, self.Derivers[code])
 
             # use ked and ._derive from code to derive aid prefix and code
             raw, code = self.derive(ked=ked)
             super(Prefixer, self).__init__(raw=raw, code=code, **kwa)
 
-        if self.code in [MtrDex.Ed25519N, MtrDex.ECDSA_256r1N, MtrDex.ECDSA_256k1N]:
-            self._verify = self._verify_non_transferable
-        elif self.code in [MtrDex.Ed25519, MtrDex.ECDSA_256r1, MtrDex.ECDSA_256k1]:
-            self._verify = self._verify_transferable
-        elif self.code == MtrDex.Blake3_256:
-            self._verify = self._verify_blake3_256
-        else:
+        if self.code not in self.Verifiers:
             raise ValueError("Unsupported code = {} for prefixer.".format(self.code))
+        self._verify = getattr(self, self.Verifiers[self.code])
 
     def derive(self, ked):
         """
@@ -3237,7 +3334,6 @@ class Prefixer(Matter):
         Returns tuple (raw, code) of basic nontransferable Ed25519 prefix (qb64)
             as derived from inception key event dict ked keys[0]
         """
-        ked = dict(ked)  # make copy so don't clobber original ked
         try:
             keys = ked["k"]
             if len(keys) != 1:
@@ -3306,7 +3402,6 @@ class Prefixer(Matter):
         Returns tuple (raw, code) of basic Ed25519 prefix (qb64)
             as derived from inception key event dict ked keys[0]
         """
-        ked = dict(ked)  # make copy so don't clobber original ked
         try:
             keys = ked["k"]
             if len(keys) != 1:
@@ -3379,18 +3474,18 @@ class Prefixer(Matter):
             ked is inception key event dict
             pre is Base64 fully qualified default to .qb64
         """
-        try:
-            raw, code = self._derive_blake3_256(ked=ked)  # replace with dummy 'i'
-            crymat = Matter(raw=raw, code=MtrDex.Blake3_256)
-            if crymat.qb64 != pre:  # derived raw with dummy 'i' must match pre
-                return False
-
+        try:  # cheap field checks first so mismatch skips serialize and digest
             if prefixed and ked["i"] != pre:  # incoming 'i' must match pre
                 return False
 
             if ked["i"] != ked["d"]:  # when digestive then SAID must match pre
                 return False
 
+            raw, code = self._derive_blake3_256(ked=ked)  # replace with dummy 'i'
+            crymat = Matter(raw=raw, code=MtrDex.Blake3_256)
+            if crymat.qb64 != pre:  # derived raw with dummy 'i' must match pre
+                return False
+
         except Exception as ex:
             return False
 
@@ -3431,6 +3526,7 @@ class Saider(Matter):
         _verify (types.MethodType): verifies said ((.qb64 ) against a given sad
 
     """
+    __slots__ = ()
     Dummy = "#"  # dummy spaceholder char for said. Must not be a valid Base64 char
     # should be same set of codes as in coring.DigestCodex coring.DigDex so
     # .digestive property works. Unit test ensures code sets match
@@ -3475,12 +3571,12 @@ class Saider(Matter):
                 else:  # use default code
                     code = MtrDex.Blake3_256
 
-            if code not in DigDex:  # need valid code
+            if code not in DigSet:  # need valid code
                 raise ValueError("Unsupported digest code = {}.".format(code))
 
-            # make copy of sad to derive said raw bytes and new sad
-            # need new sad because sets sad[label] and sad['v'] fields
-            raw, sad = self.derive(sad=dict(sad),
+            # derive makes its own copy of sad before it sets sad[label] and
+            # sad['v'] fields so no need to copy here
+            raw, sad = self.derive(sad=sad,
                                    code=code,
                                    kind=kind,
                                    label=label,
@@ -3575,7 +3671,7 @@ class Saider(Matter):
             ignore (list): fields to ignore when generating SAID
 
         """
-        if code not in DigDex or code not in clas.Digests:
+        if code not in DigSet or code not in clas.Digests:
             raise ValueError("Unsupported digest code = {}.".format(code))
 
         sad = dict(sad)  # make shallow copy so don't clobber original sad
@@ -3584,8 +3680,9 @@ class Saider(Matter):
         if 'v' in sad:  # if versioned then need to set size in version string
             raw, proto, kind, sad, version = sizeify(ked=sad, kind=kind)
 
-        ser = dict(sad)
-        if ignore:
+        ser = sad
+        if ignore:  # only copy when fields to ignore must be removed
+            ser = dict(sad)
             for f in ignore:
                 del ser[f]
 
@@ -3650,8 +3747,7 @@ class Saider(Matter):
         try:
             # override ensure code is self.code
             raw, dsad = self._derive(sad=sad, code=self.code, kind=kind, label=label, ignore=ignore)
-            saider = Saider(raw=raw, code=self.code, ignore=ignore, **kwa)
-            if self.qb64b != saider.qb64b:
+            if raw != self.raw:  # same code so raw match means .qb64b match
                 return False  # not match .qb64b
 
             if 'v' in sad and versioned:
@@ -3744,6 +3840,7 @@ class IndexedSigCodex:
         return iter(astuple(self))
 
 IdxSigDex = IndexedSigCodex()  # Make instance
+IdxSigSet = frozenset(IdxSigDex)  # set for fast membership
 
 
 @dataclass(frozen=True)
@@ -3766,6 +3863,7 @@ class IndexedCurrentSigCodex:
         return iter(astuple(self))
 
 IdxCrtSigDex = IndexedCurrentSigCodex()  # Make instance
+IdxCrtSigSet = frozenset(IdxCrtSigDex)  # set for fast membership
 
 
 
@@ -3789,6 +3887,7 @@ class IndexedBothSigCodex:
         return iter(astuple(self))
 
 IdxBthSigDex = IndexedBothSigCodex()  # Make instance
+IdxBthSigSet = frozenset(IdxBthSigDex)  # set for fast membership
 
 # namedtuple for size entries in Incexer derivation code tables
 # hs is the hard size int number of chars in hard (stable) part of code
@@ -3831,12 +3930,18 @@ class Indexer:
         ._bexfil is method to extract .code and .raw from fully qualified Base2
 
     """
+    __slots__ = ("_code", "_index", "_ondex", "_raw")  # no per instance __dict__
     Codex = IdrDex
     # Hards table maps from bytes Base64 first code char to int of hard size, hs,
     # (stable) of code. The soft size, ss, (unstable) is always > 0 for Indexer.
     Hards = ({chr(c): 1 for c in range(65, 65 + 26)})
     Hards.update({chr(c): 1 for c in range(97, 97 + 26)})
     Hards.update([('0', 2), ('1', 2), ('2', 2), ('3', 2), ('4', 2)])
+    # Selects table maps from first code char, either as str char or as int
+    # ordinal element of bytes or bytearray, to int of hard size, hs, so that
+    # ._exfil selects hs with one lookup without decoding the first char.
+    Selects = dict(Hards)
+    Selects.update({ord(c): hs for c, hs in Hards.items()})
     # Sizes table maps hs chars of code to Xizage namedtuple of (hs, ss, os, fs, ls)
     # where hs is hard size, ss is soft size, os is other index size,
     # and fs is full size, ls is lead size.
@@ -3910,10 +4015,10 @@ class Indexer:
             if isinstance(ondex, int) and os and not (ondex >= 0 and ondex <= (64 ** os - 1)):
                 raise InvalidVarIndexError(f"Invalid ondex={ondex} for code={code}.")
 
-            if code in IdxCrtSigDex and ondex is not None:
+            if code in IdxCrtSigSet and ondex is not None:
                 raise InvalidVarIndexError(f"Non None ondex={ondex} for code={code}.")
 
-            if code in IdxBthSigDex:
+            if code in IdxBthSigSet:
                 if ondex is None:  # set default
                     ondex = index  # when not provided make ondex match index
                 else:
@@ -4045,7 +4150,7 @@ class Indexer:
         ondex = self.ondex  # other index value
         raw = self.raw  # bytes or bytearray
 
-        ps = (3 - (len(raw) % 3)) % 3  # if lead then same pad size chars & lead size bytes
+        ps = -len(raw) % 3  # if lead then same pad size chars & lead size bytes
         hs, ss, os, fs, ls = self.Sizes[code]
         cs = hs + ss
         ms = ss - os
@@ -4082,7 +4187,7 @@ class Indexer:
 
         # prepend pad bytes, convert, then replace pad chars with full derivation
         # code including index,
-        full = both.encode("utf-8") + encodeB64(bytes([0] * ps) + raw)[ps - ls:]
+        full = both.encode("utf-8") + encodeB64(bytes(ps) + raw)[ps - ls:]
 
         if len(full) != fs:  # invalid size
             raise InvalidCodeSizeError(f"Invalid code={both} for raw size={len(raw)}.")
@@ -4101,7 +4206,7 @@ class Indexer:
         ondex = self.ondex  # other index value
         raw = self.raw  # bytes or bytearray
 
-        ps = (3 - (len(raw) % 3)) % 3  # same pad size chars & lead size bytes
+        ps = -len(raw) % 3  # same pad size chars & lead size bytes
         hs, ss, os, fs, ls = self.Sizes[code]
         cs = hs + ss
         ms = ss - os
@@ -4139,7 +4244,7 @@ class Indexer:
         # convert code both to right align b2 int then left shift in pad bits
         # then convert to bytes
         bcode = (b64ToInt(both) << (2 * (ps - ls))).to_bytes(n, 'big')
-        full = bcode + bytes([0] * ls) + raw
+        full = bcode + bytes(ls) + raw
 
         bfs = len(full)  # binary full size
         if bfs % 3 or (bfs * 4 // 3) != fs:  # invalid size
@@ -4159,30 +4264,31 @@ class Indexer:
         if not qb64b:  # empty need more bytes
             raise ShortageError("Empty material.")
 
-        first = qb64b[:1]  # extract first char code selector
-        if hasattr(first, "decode"):
-            first = first.decode("utf-8")
-        if first not in self.Hards:
-            if first[0] == '-':
+        hs = self.Selects.get(qb64b[0])  # int for bytes, str char for str
+        if hs is None:  # unsupported first char code selector
+            first = qb64b[:1]
+            if hasattr(first, "decode"):
+                first = first.decode("utf-8")
+            if first == '-':
                 raise UnexpectedCountCodeError("Unexpected count code start"
                                                "while extracing Indexer.")
-            elif first[0] == '_':
+            elif first == '_':
                 raise UnexpectedOpCodeError("Unexpected  op code start"
                                             "while extracing Indexer.")
             else:
                 raise UnexpectedCodeError(f"Unsupported code start char={first}.")
 
-        hs = self.Hards[first]  # get hard code size
         if len(qb64b) < hs:  # need more bytes
             raise ShortageError(f"Need {hs - len(qb64b)} more characters.")
 
         hard = qb64b[:hs]  # get hard code
         if hasattr(hard, "decode"):
             hard = hard.decode("utf-8")
-        if hard not in self.Sizes:
+        xizage = self.Sizes.get(hard)  # one lookup for both check and sizes
+        if xizage is None:
             raise UnexpectedCodeError(f"Unsupported code ={hard}.")
 
-        hs, ss, os, fs, ls = self.Sizes[hard]  # assumes hs in both tables consistent
+        hs, ss, os, fs, ls = xizage  # assumes hs in both tables consistent
         cs = hs + ss  # both hard + soft code size
         ms = ss - os
         # assumes that unit tests on Indexer and IndexerCodex ensure that
@@ -4193,16 +4299,11 @@ class Indexer:
         if len(qb64b) < cs:  # need more bytes
             raise ShortageError(f"Need {cs - len(qb64b)} more characters.")
 
-        index = qb64b[hs:hs+ms]  # extract index/size chars
-        if hasattr(index, "decode"):
-            index = index.decode("utf-8")
-        index = b64ToInt(index)  # compute int index
-
+        # b64ToInt takes bytes directly so no need to decode index chars
+        index = b64ToInt(qb64b[hs:hs+ms])  # compute int index from index chars
         ondex = qb64b[hs+ms:hs+ms+os]  # extract ondex chars
-        if hasattr(ondex, "decode"):
-            ondex = ondex.decode("utf-8")
 
-        if hard in IdxCrtSigDex:  # if current sig then ondex from code must be 0
+        if hard in IdxCrtSigSet:  # if current sig then ondex from code must be 0
             ondex = b64ToInt(ondex) if os else None  # compute ondex from code
             if ondex:  # not zero or None so error
                 raise ValueError(f"Invalid ondex={ondex} for code={hard}.")
@@ -4228,35 +4329,30 @@ class Indexer:
         if hasattr(qb64b, "encode"):  # only convert extracted chars from stream
             qb64b = qb64b.encode("utf-8")
 
-        # strip off prepended code and append pad characters
-        #ps = cs % 4  # pad size ps = cs mod 4, same pad chars and lead bytes
-        #base = ps * b'A' + qb64b[cs:]  # replace prepend code with prepad zeros
-        #raw = decodeB64(base)[ps+ls:]  # decode and strip off ps+ls prepad bytes
-
         # check for non-zeroed pad bits or lead bytes
+        # decode whole qb64b in one pass instead of first splicing a prepad
+        # onto a copy of the material. Code chars plus ps pad bit pairs decode
+        # to exactly cb = (3 * cs + ps) // 4 leading bytes of paw
         ps = cs % 4  # code pad size ps = cs mod 4
         pbs = 2 * (ps if ps else ls)  # pad bit size in bits
+        cb = (3 * cs + ps) // 4  # code bytes including pad bits
+        paw = decodeB64(qb64b)  # decode code + lead chars + val
         if ps:  # ps. IF ps THEN not ls (lead) and vice versa OR not ps and not ls
-            base = ps * b'A' + qb64b[cs:]  # replace pre code with prepad chars of zero
-            paw = decodeB64(base)  # decode base to leave prepadded raw
-            pi = (int.from_bytes(paw[:ps], "big"))  # prepad as int
-            if pi & (2 ** pbs - 1 ):  # masked pad bits non-zero
+            pi = paw[cb - 1]  # pad bits are low bits of last code byte
+            pm = (1 << pbs) - 1  # pad bit mask
+            if pi & pm:  # masked pad bits non-zero
                 raise ValueError(f"Non zeroed prepad bits = "
-                                 f"{pi & (2 ** pbs - 1 ):<06b} in {qb64b[cs:cs+1]}.")
-            raw = paw[ps:]  # strip off ps prepad paw bytes
+                                 f"{pi & pm:<06b} in {qb64b[cs:cs+1]}.")
+            raw = paw[cb:]  # strip off code bytes
         else:  # not ps. IF not ps THEN may or may not be ls (lead)
-            base = qb64b[cs:]  # strip off code leaving lead chars if any and value
-            # decode lead chars + val leaving lead bytes + raw bytes
-            # then strip off ls lead bytes leaving raw
-            paw = decodeB64(base) # decode base to leave prepadded paw bytes
-            li = int.from_bytes(paw[:ls], "big")  # lead as int
+            li = int.from_bytes(paw[cb:cb + ls], "big")  # lead as int
             if li:  # pre pad lead bytes must be zero
                 if ls == 1:
                     raise ValueError(f"Non zeroed lead byte = 0x{li:02x}.")
                 else:
                     raise ValueError(f"Non zeroed lead bytes = 0x{li:04x}.")
 
-            raw = paw[ls:]
+            raw = paw[cb + ls:]  # paw is bytes so raw is bytes
 
         if len(raw) != (len(qb64b) - cs) * 3 // 4:  # exact lengths
             raise ConversionError(f"Improperly qualified material = {qb64b}")
@@ -4313,7 +4409,7 @@ class Indexer:
         both = codeB2ToB64(qb2, cs)  # extract and convert both hard and soft part of code
         index = b64ToInt(both[hs:hs+ms])  # compute index
 
-        if hard in IdxCrtSigDex:  # if current sig then ondex from code must be 0
+        if hard in IdxCrtSigSet:  # if current sig then ondex from code must be 0
             ondex = b64ToInt(both[hs+ms:hs+ms+os]) if os else None  # compute ondex from code
             if ondex:  # not zero or None so error
                 raise ValueError(f"Invalid ondex={ondex} for code={hard}.")
@@ -4322,7 +4418,7 @@ class Indexer:
         else:
             ondex = b64ToInt(both[hs+ms:hs+ms+os]) if os else index
 
-        if hard in IdxCrtSigDex:  # if current sig then ondex from code must be 0
+        if hard in IdxCrtSigSet:  # if current sig then ondex from code must be 0
             if ondex:  # not zero so error
                 raise ValueError(f"Invalid ondex={ondex} for code={hard}.")
             else:  # zero so set to None
@@ -4349,9 +4445,10 @@ class Indexer:
         if ps:  # ps. IF ps THEN not ls (lead) and vice versa OR not ps and not ls
             # convert last byte of code bytes in which are pad bits to int
             pi = (int.from_bytes(qb2[bcs-1:bcs], "big"))
-            if pi & (2 ** pbs - 1 ):  # masked pad bits non-zero
+            pm = (1 << pbs) - 1  # pad bit mask
+            if pi & pm:  # masked pad bits non-zero
                 raise ValueError(f"Non zeroed pad bits = "
-                                 f"{pi & (2 ** pbs - 1 ):>08b} in 0x{pi:02x}.")
+                                 f"{pi & pm:>08b} in 0x{pi:02x}.")
         else:  # not ps. IF not ps THEN may or may not be ls (lead)
             li = int.from_bytes(qb2[bcs:bcs+ls], "big")  # lead as int
             if li:  # pre pad lead bytes must be zero
@@ -4393,6 +4490,7 @@ class Siger(Indexer):
 
 
     """
+    __slots__ = ("_verfer", )
 
     def __init__(self, verfer=None, **kwa):
         """Initialze instance
@@ -4402,7 +4500,7 @@ class Siger(Indexer):
 
         """
         super(Siger, self).__init__(**kwa)
-        if self.code not in IdxSigDex:
+        if self.code not in IdxSigSet:
             raise ValidationError("Invalid code = {} for Siger."
                                   "".format(self.code))
         self.verfer = verfer
@@ -4538,6 +4636,7 @@ class Counter:
         ._exfil is method to extract .code and .raw from fully qualified Base64
 
     """
+    __slots__ = ("_code", "_count")  # no per instance __dict__
     Codex = CtrDex
     # Hards table maps from bytes Base64 first two code chars to int of
     # hard size, hs,(stable) of code. The soft size, ss, (unstable) for Counter
@@ -4734,27 +4833,14 @@ class Counter:
         """
         Returns fully qualified attached sig base64 bytes computed from
         self.code and self.count.
+
+        .code sizes and .count range are validated when the counter is made
+        and both are read only so no need to validate again here.
         """
         code = self.code  # codex value chars hard code
-        count = self.count  # index value int used for soft
-
-        hs, ss, fs, ls = self.Sizes[code]
-        cs = hs + ss  # both hard + soft size
-        if fs != cs or cs % 4:  # fs must be bs and multiple of 4 for count codes
-            raise InvalidCodeSizeError("Whole code size not full size or not "
-                                       "multiple of 4. cs={} fs={}.".format(cs, fs))
-        if count < 0 or count > (64 ** ss - 1):
-            raise InvalidVarIndexError("Invalid count={} for code={}.".format(count, code))
-
+        ss = self.Sizes[code].ss  # soft size
         # both is hard code + converted count
-        both = "{}{}".format(code, intToB64(count, l=ss))
-
-        # check valid pad size for whole code size
-        if len(both) % 4:  # no pad
-            raise InvalidCodeSizeError("Invalid size = {} of {} not a multiple of 4."
-                                       .format(len(both), both))
-        # prepending full derivation code with index and strip off trailing pad characters
-        return (both.encode("utf-8"))
+        return ((code + intToB64(self.count, l=ss)).encode("utf-8"))
 
 
     def _binfil(self):
@@ -4762,26 +4848,16 @@ class Counter:
         Returns bytes of fully qualified base2 bytes, that is .qb2
         self.code converted to Base2 left shifted with pad bits
         equivalent of Base64 decode of .qb64 into .qb2
+
+        .code sizes and .count range are validated when the counter is made
+        and both are read only so no need to validate again here.
         """
         code = self.code  # codex chars hard code
-        count = self.count  # index value int used for soft
-
         hs, ss, fs, ls = self.Sizes[code]
-        cs = hs + ss
-        if fs != cs or cs % 4:  # fs must be cs and multiple of 4 for count codes
-            raise InvalidCodeSizeError("Whole code size not full size or not "
-                                       "multiple of 4. cs={} fs={}.".format(cs, fs))
-
-        if count < 0 or count > (64 ** ss - 1):
-            raise InvalidVarIndexError("Invalid count={} for code={}.".format(count, code))
-
-        # both is hard code + converted count
-        both = "{}{}".format(code, intToB64(count, l=ss))
-        if len(both) != cs:
-            raise InvalidCodeSizeError("Mismatch code size = {} with table = {}."
-                                       .format(cs, len(both)))
-
-        return (codeB64ToB2(both))  # convert to b2 left shift if any
+        # cs = hs + ss is multiple of 4 so no pad bits. Shift in count sextets
+        # after hard code sextets directly instead of via Base64 both str
+        return (((b64ToInt(code) << (6 * ss)) | self.count)
+                .to_bytes((hs + ss) * 3 // 4, 'big'))
 
 
     def _exfil(self, qb64b):
@@ -4821,10 +4897,8 @@ class Counter:
         if len(qb64b) < cs:  # need more bytes
             raise ShortageError("Need {} more characters.".format(cs - len(qb64b)))
 
-        count = qb64b[hs:hs + ss]  # extract count chars
-        if hasattr(count, "decode"):
-            count = count.decode("utf-8")
-        count = b64ToInt(count)  # compute int count
+        # b64ToInt takes bytes directly so no need to decode count chars
+        count = b64ToInt(qb64b[hs:hs + ss])  # compute int count from count chars
 
         self._code = hard
         self._count = count
@@ -5065,7 +5139,13 @@ class Sadder:
 
     @kind.setter
     def kind(self, kind):
-        """ kind property setter Assumes ._ked. Serialization kind. """
+        """ kind property setter Assumes ._ked. Serialization kind.
+        No op when kind is unchanged so does not reserialize ._ked. Edits made
+        in place to dict from .ked getter must be assigned back via .ked setter
+        to update .raw, .size, and .saider.
+        """
+        if kind == self._kind:
+            return
         raw, proto, kind, ked, version = self._exhale(ked=self._ked, kind=kind)
         size = len(raw)
         self._raw = raw[:size]
@@ -5398,8 +5478,9 @@ class Tholder:
         ._size is int minimum size of of keys list
         ._sith is signing threshold for .sith property
         ._thold is signing threshold for .thold propery
-        ._bexter is Bexter instance of weighted signing threshold or None
-        ._number is Number instance of integer threshold or None
+        ._limen is qb64b of limen computed on first access or None
+        ._wholds is list of (lcd, weights) per clause of ._thold with each
+            Fraction weight scaled to int over clause least common denominator
         ._satisfy is method reference of threshold specified verification method
         ._satisfy_numeric is numeric threshold verification method
         ._satisfy_weighted is fractional weighted threshold verification method
@@ -5484,8 +5565,19 @@ class Tholder:
 
     @property
     def limen(self):
-        """ limen property getter """
-        return self._bexter.qb64b if self._weighted else self._number.qb64b
+        """ limen property getter
+        Computed on first access and cached since rarely needed after parsing
+        """
+        if self._limen is None:
+            if self._weighted:  # make bext str of thold for Bexter
+                bext = [[f"{f.numerator}s{f.denominator}" if (0 < f < 1) else f"{int(f)}"
+                                                   for f in clause]
+                                                           for clause in self.thold]
+                bext = "a".join(["c".join(clause) for clause in bext])
+                self._limen = Bexter(bext=bext).qb64b
+            else:
+                self._limen = Number(num=self.thold).qb64b
+        return self._limen
 
     @property
     def sith(self):
@@ -5538,11 +5630,11 @@ class Tholder:
             limen (str): CESR encoded qb64 threshold (weighted or unweighted)
         """
         matter = Matter(qb64b=limen, **kwa)  # kwa for strip of stream
-        if matter.code in NumDex:
+        if matter.code in NumSet:
             number = Number(raw=matter.raw, code=matter.code, **kwa)
             self._processUnweighted(thold=number.num)
 
-        elif matter.code in BexDex:
+        elif matter.code in BexSet:
             # Convert to fractional thold expression
             bexter = Bexter(raw=matter.raw, code=matter.code, **kwa)
             t = bexter.bext.replace('s', '/')
@@ -5629,8 +5721,7 @@ class Tholder:
         self._weighted = False
         self._size = self._thold  # used to verify that keys list size is at least size
         self._satisfy = self._satisfy_numeric
-        self._number = Number(num=thold)
-        self._bexter = None
+        self._limen = None  # computed lazily by .limen
 
 
     def _processWeighted(self, thold=[]):
@@ -5650,14 +5741,13 @@ class Tholder:
         self._thold = thold
         self._weighted = True
         self._size = sum(len(clause) for clause in thold)
+        # scale weights to ints so satisfy need not do Fraction arithmetic
+        self._wholds = []
+        for clause in thold:
+            lcd = math.lcm(*(w.denominator for w in clause))
+            self._wholds.append((lcd, [int(w * lcd) for w in clause]))
         self._satisfy = self._satisfy_weighted
-        # make bext str of thold for .bexter for limen
-        bext = [[f"{f.numerator}s{f.denominator}" if (0 < f < 1) else f"{int(f)}"
-                                           for f in clause]
-                                                           for clause in thold]
-        bext = "a".join(["c".join(clause) for clause in bext])
-        self._number = None
-        self._bexter = Bexter(bext=bext)
+        self._limen = None  # computed lazily by .limen
 
 
     @staticmethod
@@ -5683,6 +5773,24 @@ class Tholder:
         Parameters:
             w (str): threshold weight expression
         """
+        if isinstance(w, str):  # only str cached since 1, 1.0, True hash same
+            return Tholder._cachedWeight(w)
+        return Tholder._parseWeight(w)
+
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _cachedWeight(w: str) -> Fraction:
+        """Returns ._parseWeight(w) cached by str w since same few weight strs
+        recur across events and returned int or Fraction is immutable.
+        """
+        return Tholder._parseWeight(w)
+
+
+    @staticmethod
+    def _parseWeight(w: str) -> Fraction:
+        """Returns valid weight from w else raises error. See .weight
+        """
         try:  # float str or ratio str raises ValueError
             if int(float(w)) != float(w):  # float str
                 raise TypeError("Invalid weight str got float w={w}.")
@@ -5718,14 +5826,7 @@ class Tholder:
         Parameters:
             indices is list of indices (offsets into key list) of verified signatures
         """
-        try:
-            if self.thold > 0 and len(indices) >= self.thold:  # at least one
-                return True
-
-        except Exception as ex:
-            return False
-
-        return False
+        return self._thold > 0 and len(indices) >= self._thold  # at least one
 
 
     def _satisfy_weighted(self, indices):
@@ -5743,20 +5844,18 @@ class Tholder:
             if not indices:  # empty indices
                 return False
 
-            # remove duplicates with set, sort low to high
-            indices = sorted(set(indices))
             sats = [False] * self.size  # default all satifactions to False
             for idx in indices:
                 sats[idx] = True  # set verified signature index to True
 
             wio = 0  # weight index offset
-            for clause in self.thold:
+            for lcd, clause in self._wholds:  # int weights scaled by lcd
                 cw = 0  # init clause weight
                 for w in clause:
                     if sats[wio]:  # verified signature so weight applies
                         cw += w
                     wio += 1
-                if cw < 1:  # each clause must sum to at least 1
+                if cw < lcd:  # each clause must sum to at least 1 (lcd/lcd)
                     return False
 
             return True  # all clauses including final one cw >= 1
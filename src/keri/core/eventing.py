@@ -14,9 +14,9 @@ from ordered_set import OrderedSet as oset
 from hio.help import decking
 
 from . import coring
-from .coring import (versify, Serials, Ilks, MtrDex, NonTransDex, CtrDex, Counter,
-                     Number, Seqner, Siger, Cigar, Dater, Indexer, IdrDex,
-                     Verfer, Diger, Prefixer, Serder, Tholder, Saider)
+from .coring import (versify, Serials, Ilks, MtrDex, NonTransSet,
+                     CtrDex, Counter, Number, Seqner, Siger, Cigar, Dater,
+                     Indexer, IdrDex, Verfer, Diger, Prefixer, Serder, Tholder, Saider)
 from .. import help
 from .. import kering
 from ..db import basing, dbing
@@ -466,20 +466,18 @@ def verifySigs(raw, sigers, verfers):
     # indices count for threshold will be erroneous. Does not modify in place
     # passed in sigers list, but instead depends on caller to use indices to
     # modify its copy to filter out unverifiable or duplicate sigers
-    usigs = oset([siger.qb64 for siger in sigers])
-    usigers = [Siger(qb64=sig) for sig in usigs]
+    # dict keeps first seen order of unique sigs and qb64b avoids str round trip
+    usigers = [Siger(qb64b=sig) for sig in dict.fromkeys(siger.qb64b for siger in sigers)]
 
     # verify indexes of attached signatures against verifiers and assign
-    # verfer to each siger
+    # verfer to each siger, then verify in same pass over the batch of sigers
+    # creating lists of unique verified signatures and indices
+    vindices = []
+    vsigers = []
     for siger in usigers:
         if siger.index >= len(verfers):
             logger.info("Skipped sig: Index=%s to large.\n", siger.index)
         siger.verfer = verfers[siger.index]  # assign verfer
-
-    # create lists of unique verified signatures and indices
-    vindices = []
-    vsigers = []
-    for siger in usigers:
         if siger.verfer.verify(siger.raw, raw):
             vindices.append(siger.index)
             vsigers.append(siger)
@@ -636,7 +634,7 @@ def incept(keys,
 
 
     wits = wits if wits is not None else []
-    if len(oset(wits)) != len(wits):
+    if len(set(wits)) != len(wits):
         raise ValueError(f"Invalid wits = {wits}, has duplicates.")
 
     if toad is None:
@@ -1420,7 +1418,7 @@ def messagize(serder, *, sigers=None, seal=None, wigers=None, cigars=None,
     if wigers:
         atc.extend(Counter(code=CtrDex.WitnessIdxSigs, count=len(wigers)).qb64b)
         for wiger in wigers:
-            if wiger.verfer and wiger.verfer.code not in NonTransDex:
+            if wiger.verfer and wiger.verfer.code not in NonTransSet:
                 raise ValueError("Attempt to use tranferable prefix={} for "
                                  "receipt.".format(wiger.verfer.qb64))
             atc.extend(wiger.qb64b)
@@ -1428,7 +1426,7 @@ def messagize(serder, *, sigers=None, seal=None, wigers=None, cigars=None,
     if cigars:
         atc.extend(Counter(code=CtrDex.NonTransReceiptCouples, count=len(cigars)).qb64b)
         for cigar in cigars:
-            if cigar.verfer.code not in NonTransDex:
+            if cigar.verfer.code not in NonTransSet:
                 raise ValueError("Attempt to use tranferable prefix={} for "
                                  "receipt.".format(cigar.verfer.qb64))
             atc.extend(cigar.verfer.qb64b)
@@ -1498,7 +1496,7 @@ def proofize(sadtsgs=None, *, sadsigers=None, sadcigars=None, pipelined=False):
 
         atc.extend(coring.Counter(code=coring.CtrDex.NonTransReceiptCouples, count=len(sadcigars)).qb64b)
         for cigar in cigars:
-            if cigar.verfer.code not in coring.NonTransDex:
+            if cigar.verfer.code not in coring.NonTransSet:
                 raise ValueError("Attempt to use tranferable prefix={} for "
                                  "receipt.".format(cigar.verfer.qb64))
             atc.extend(cigar.verfer.qb64b)
@@ -1843,7 +1841,7 @@ class Kever:
             raise ValidationError("Invalid inception wits not empty for "
                                   "non-transferable prefix = {} for evt = {}."
                                   "".format(self.prefixer.qb64, ked))
-        if len(oset(wits)) != len(wits):
+        if len(set(wits)) != len(wits):
             raise ValidationError("Invalid backers = {}, has duplicates for evt = {}."
                                   "".format(wits, ked))
         self.wits = wits
@@ -2266,7 +2264,7 @@ class Kever:
         if serder.pre not in self.prefixes:
             if ((wits and not self.prefixes) or  # in promiscuous mode so assume must verify toad
                     (wits and self.prefixes and not self.local and  # not promiscuous nonlocal
-                     not (oset(self.prefixes) & oset(wits)))):  # own prefix is not a witness
+                     set(self.prefixes).isdisjoint(wits))):  # own prefix is not a witness
                 # validate that event is fully witnessed
 
                 if wits:
@@ -2326,8 +2324,8 @@ class Kever:
                 #raise ValidationError(f'Invalid ondex={siger.ondex} '
                                       #f'to expose digest.') from ex
 
-            kdig = Diger(ser=siger.verfer.qb64b, code=diger.code).qb64
-            if kdig == diger.qb64:
+            # digest of key with diger's code matches diger's raw digest
+            if diger.verify(ser=siger.verfer.qb64b):
                 odxs.append(siger.ondex)
 
         return odxs
@@ -4049,12 +4047,14 @@ class Kevery:
         # with different algos.  Can't lookup event by dig for same reason. Must
         # lookup last event by sn not by dig.
         self.db.putDts(dgKey(serder.preb, said), helping.nowIso8601().encode("utf-8"))
+        saidb = said.encode("utf-8")  # encode once not per couple
+        snkey = snKey(serder.preb, serder.sn)
         for wiger in wigers:  # escrow each couple
             # don't know witness pre yet without witness list so no verfer in wiger
             # if wiger.verfer.transferable:  # skip transferable verfers
             # continue  # skip invalid triplets
-            couple = said.encode("utf-8") + wiger.qb64b
-            self.db.addUwe(key=snKey(serder.preb, serder.sn), val=couple)
+            couple = saidb + wiger.qb64b
+            self.db.addUwe(key=snkey, val=couple)
         # log escrowed
         logger.info("Kevery process: escrowed unverified witness indexed receipt"
                     " of pre= %s sn=%x dig=%s\n", serder.pre, serder.sn, said)
@@ -4081,11 +4081,13 @@ class Kevery:
         # with different algos.  Can't lookup event by dig for same reason. Must
         # lookup last event by sn not by dig.
         self.db.putDts(dgKey(serder.preb, said), helping.nowIso8601().encode("utf-8"))
+        saidb = said.encode("utf-8")  # encode once not per triple
+        snkey = snKey(serder.preb, serder.sn)
         for cigar in cigars:  # escrow each triple
             if cigar.verfer.transferable:  # skip transferable verfers
                 continue  # skip invalid triplets
-            triple = said.encode("utf-8") + cigar.verfer.qb64b + cigar.qb64b
-            self.db.addUre(key=snKey(serder.preb, serder.sn), val=triple)  # should be snKey
+            triple = saidb + cigar.verfer.qb64b + cigar.qb64b
+            self.db.addUre(key=snkey, val=triple)  # should be snKey
         # log escrowed
         logger.info("Kevery process: escrowed unverified receipt of pre= %s "
                     " sn=%x dig=%s\n", serder.pre, serder.sn, said)
@@ -5135,7 +5137,7 @@ class Kevery:
             # Extract or compute witness list
             if serder.ked['t'] in (Ilks.icp, Ilks.dip):  # inception get from event
                 wits = serder.ked['b']  # get wits from event itself
-                if len(oset(wits)) != len(wits):
+                if len(set(wits)) != len(wits):
                     raise ValidationError("Invalid wits = {}, has duplicates for evt = {}."
                                           "".format(wits, serder.ked))
 
@@ -6,6 +6,7 @@ keri.core.serdering module
 import copy
 import json
 from collections import namedtuple
+from functools import lru_cache
 
 import cbor2 as cbor
 import msgpack
@@ -17,11 +18,12 @@ from .. import kering
 from ..kering import (ValidationError,  MissingFieldError,
                       ShortageError, VersionError, ProtocolError, KindError,
                       DeserializeError, FieldError, SerializeError)
-from ..kering import (Versionage, Version, Vrsn_1_0, Vrsn_1_1,
+from ..kering import (Version, Vrsn_1_0, Vrsn_1_1,
                       VERRAWSIZE, VERFMT, VERFULLSIZE)
-from ..kering import Protos, Serials, Rever, versify, deversify, Ilks
+from ..kering import Protos, Serials, versify, deversify, smell, Ilks
 from ..core import coring
-from .coring import MtrDex, DigDex, PreDex, Saids,  Digestage
+from .coring import (MtrDex, DigDex, DigSet, PreSet, Saids, Digestage,
+                     Jsoner)
 from .coring import Matter, Saider, Verfer, Diger, Number, Tholder
 
 from .. import help
@@ -29,6 +31,21 @@ from ..help import helping
 
 logger = help.ogler.getLogger()
 
+
+@lru_cache(maxsize=4096)
+def _smell(head, limit):
+    """Returns smell(head, limit) cached by head bytes and limit
+
+    Parameters:
+        head (bytes): leading limit + VERFULLSIZE bytes of raw which must hold
+            the whole version string when any
+        limit (int): max offset of start of version string in head
+
+    Events of the same protocol, kind and size share the same head so replay
+    of a KEL mostly hits the cache. Results are immutable tuples.
+    """
+    return smell(head, limit=limit)
+
 """
 Fieldage
     saids (dict): keyed by saidive field labels with values as default codes
@@ -45,12 +62,12 @@ Fieldage = namedtuple("Fieldage", "saids alls")  #values are dicts
 """
 Reapage
     proto (str): protocol type value of Protos examples 'KERI', 'ACDC'
-    major (str): single char hex string of major version number
-    minor (str): single char hex string of minor version number
+    vrsn (Versionage): version tuple of (major, minor) version ints
     kind (str): serialization value of Serials examples 'JSON', 'CBOR', 'MGPK'
+    size (int): size in bytes of serialization from version string
 
 """
-Reapage = namedtuple("Reapage", "proto major minor kind size")
+Reapage = namedtuple("Reapage", "proto vrsn kind size")
 
 
 class Serdery:
@@ -77,16 +94,16 @@ class Serdery:
         if len(ims) < Serder.InhaleSize:
             raise ShortageError(f"Need more raw bytes for Serdery to reap.")
 
-        match = Rever.search(ims)  # Rever regex takes bytes/bytearray not str
-        if not match or match.start() > Serder.MaxVSOffset:
+        smelled = _smell(bytes(ims[:Serder.InhaleSize]), Serder.MaxVSOffset)
+        if not smelled:
             raise VersionError(f"Invalid version string for Serder raw = "
                                f"{ims[: Serder.InhaleSize]}.")
 
-        reaped = Reapage(*match.group("proto", "major", "minor", "kind", "size"))
+        reaped = Reapage(*smelled[:4])  # drop fore offset
 
-        if reaped.proto == Protos.keri.encode("utf-8"):
+        if reaped.proto == Protos.keri:
             return SerderKERI(raw=ims, strip=True, version=version, reaped=reaped)
-        elif reaped.proto == Protos.acdc.encode("utf-8"):
+        elif reaped.proto == Protos.acdc:
             return SerderACDC(raw=ims, strip=True, version=version, reaped=reaped)
         else:
             raise ProtocolError(f"Unsupported protocol type = {reaped.proto}.")
@@ -527,18 +544,18 @@ class Serder:
             try:  # replace default code with code of value from sad
                 saids[label] = Matter(qb64=sad[label]).code
             except Exception as ex:
-                if saids[label] in DigDex:  # digestive but invalid
+                if saids[label] in DigSet:  # digestive but invalid
                     raise ValidationError(f"Invalid said field '{label}' in sad\n"
                                       f" = {self._sad}.") from ex
 
-            if saids[label] in DigDex:  # if digestive then replace with dummy
+            if saids[label] in DigSet:  # if digestive then replace with dummy
                 sad[label] = self.Dummy * len(sad[label])
 
 
         raw = self.dumps(sad, kind=self.kind)  # serialize dummied sad copy
 
         for label, code in saids.items():
-            if code in DigDex:  # subclass override if non digestive allowed
+            if code in DigSet:  # subclass override if non digestive allowed
                 klas, size, length = self.Digests[code]  # digest algo size & length
                 ikwa = dict()  # digest algo class initi keyword args
                 if size:
@@ -685,7 +702,7 @@ class Serder:
                 except Exception:
                     pass  # no override
 
-            if _saids[label] in DigDex:  # if digestive then fill with dummy
+            if _saids[label] in DigSet:  # if digestive then fill with dummy
                 sad[label] = self.Dummy * Matter.Sizes[_saids[label]].fs
 
 
@@ -707,7 +724,7 @@ class Serder:
         raw = self.dumps(sad, kind=kind)  # serialize sized dummied sad
 
         for label, code in _saids.items():
-            if code in DigDex:  # subclass override if non digestive allowed
+            if code in DigSet:  # subclass override if non digestive allowed
                 klas, dsize, dlen = self.Digests[code]  # digest algo size & length
                 ikwa = dict()  # digest algo class initi keyword args
                 if dsize:
@@ -768,36 +785,28 @@ class Serder:
 
         """
         if reaped:
-            proto, major, minor, kind, size = reaped  # tuple unpack
+            proto, vrsn, kind, size = reaped  # tuple unpack
         else:
             if len(raw) < clas.InhaleSize:
                 raise ShortageError(f"Need more raw bytes for Serder to inhale.")
 
-            match = Rever.search(raw)  # Rever regex takes bytes/bytearray not str
-            if not match or match.start() > clas.MaxVSOffset:
+            smelled = _smell(bytes(raw[:clas.InhaleSize]), clas.MaxVSOffset)
+            if not smelled:
                 raise VersionError(f"Invalid version string in raw = "
                                    f"{raw[:clas.InhaleSize]}.")
 
-            proto, major, minor, kind, size = match.group("proto",
-                                                          "major",
-                                                          "minor",
-                                                          "kind",
-                                                          "size")
+            proto, vrsn, kind, size, _ = smelled
 
-        proto = proto.decode("utf-8")
         if proto not in Protos:
             raise ProtocolError(f"Invalid protocol type = {proto}.")
 
-        vrsn = Versionage(major=int(major, 16), minor=int(minor, 16))
         if version is not None and vrsn != version:
             raise VersionError(f"Expected version = {version}, got "
                                f"{vrsn.major}.{vrsn.minor}.")
 
-        kind = kind.decode("utf-8")
         if kind not in Serials:
             raise KindError(f"Invalid serialization kind = {kind}.")
 
-        size = int(size, 16)
         if len(raw) < size:
             raise ShortageError(f"Need more bytes.")
 
@@ -886,14 +895,16 @@ class Serder:
         # generate new version string with correct size
         vs = versify(proto=proto, version=vrsn, kind=kind, size=size)
 
-        # find location of old version string inside raw
-        match = Rever.search(raw)  # Rever's regex takes bytes
-        if not match or match.start() > 12:
+        # find location of old version string inside raw. Old one is known and
+        # already validated by deversify so plain find not regex search
+        old = sad["v"].encode("utf-8")
+        fore = raw.find(old, 0, clas.MaxVSOffset + len(old))
+        if fore < 0:
             raise SerializeError(f"Invalid version string in raw = {raw}.")
-        fore, back = match.span()  # start and end positions of version string
+        back = fore + len(old)  # start and end positions of version string
 
         # replace old version string in raw with new one
-        raw = b'%b%b%b' % (raw[:fore], vs.encode("utf-8"), raw[back:])
+        raw = raw[:fore] + vs.encode("utf-8") + raw[back:]  # concat beats %b format
         if size != len(raw):  # substitution messed up
             raise SerializeError(f"Malformed size of raw in version string == {vs}")
         sad["v"] = vs  # update sad
@@ -914,8 +925,7 @@ class Serder:
                 "JSON", "MGPK", "CBOR"
         """
         if kind == Serials.json:
-            raw = json.dumps(sad, separators=(",", ":"),
-                             ensure_ascii=False).encode("utf-8")
+            raw = Jsoner.encode(sad).encode("utf-8")
 
         elif kind == Serials.mgpk:
             raw = msgpack.dumps(sad)
@@ -1065,6 +1075,23 @@ class SerderKERI(Serder):
     Protocol = Protos.keri  # required protocol, None means any in Protos is ok
     Proto = Protos.keri  # default protocol type
 
+    # caches of primitives parsed from ._sad on first access. Reset by makify
+    # since it reassigns ._sad.
+    _sner = None  # Number instance of ._sad["s"]
+    _verfers = None  # list of Verfer instances of ._sad["k"]
+    _ndigers = None  # list of Diger instances of ._sad["n"]
+
+
+    def makify(self, sad, **kwa):
+        """Makify given sad dict and reset caches of primitives parsed from
+        prior ._sad.
+
+        See Serder.makify for parameters
+        """
+        super(SerderKERI, self).makify(sad, **kwa)
+        self._sner = None
+        self._verfers = None
+        self._ndigers = None
 
 
     def _verify(self, **kwa):
@@ -1094,7 +1121,7 @@ class SerderKERI(Serder):
                 raise ValidationError(f"Invalid identifier prefix = "
                                       f"{self.pre}.") from ex
 
-            if code not in PreDex:
+            if code not in PreSet:
                 raise ValidationError(f"Invalid identifier prefix code = {code}.")
 
 
@@ -1141,8 +1168,9 @@ class SerderKERI(Serder):
         Returns:
             (Number): of ._sad["s"] hex number str converted
         """
-        # auto converts hex num str to int
-        return Number(num=self._sad["s"]) if 's' in self._sad else None
+        if self._sner is None and 's' in self._sad:
+            self._sner = Number(num=self._sad["s"])  # auto converts hex num str to int
+        return self._sner
 
 
     @property
@@ -1152,7 +1180,8 @@ class SerderKERI(Serder):
         Returns:
             sn (int): of .sner.num from .sad["s"]
         """
-        return self.sner.num if self.sner is not None else None
+        sner = self.sner
+        return sner.num if sner is not None else None
 
     @property
     def seals(self):
@@ -1192,8 +1221,12 @@ class SerderKERI(Serder):
         One for each key.
         verfers property getter
         """
-        keys = self._sad.get("k")
-        return [Verfer(qb64=key) for key in keys] if keys is not None else None
+        if self._verfers is None:
+            keys = self._sad.get("k")
+            if keys is None:
+                return None
+            self._verfers = [Verfer(qb64=key) for key in keys]
+        return list(self._verfers)  # copy so caller may not alter cache
 
 
     @property
@@ -1215,8 +1248,12 @@ class SerderKERI(Serder):
         if self.vrsn.major < 2 and self.vrsn.minor < 1 and self.ilk == Ilks.vcp:
             return None
 
-        digs = self._sad.get("n")
-        return [Diger(qb64=dig) for dig in digs] if digs is not None else None
+        if self._ndigers is None:
+            digs = self._sad.get("n")
+            if digs is None:
+                return None
+            self._ndigers = [Diger(qb64=dig) for dig in digs]
+        return list(self._ndigers)  # copy so caller may not alter cache
 
 
     @property
@@ -1348,7 +1385,7 @@ class SerderCREL(Serder):
             raise ValidationError(f"Invalid issuer AID = "
                                   f"{self.isr}.") from ex
 
-        if code not in PreDex:
+        if code not in PreSet:
             raise ValidationError(f"Invalid issuer AID code = {code}.")
 
 
@@ -1399,7 +1436,7 @@ class SerderACDC(Serder):
             raise ValidationError(f"Invalid issuer AID = "
                                   f"{self.isr}.") from ex
 
-        if code not in PreDex:
+        if code not in PreSet:
             raise ValidationError(f"Invalid issuer AID code = {code}.")
 
 
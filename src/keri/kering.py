@@ -31,19 +31,32 @@ VERFULLSIZE = 17  # number of characters in full version string
 
 VEREX = b'(?P<proto>[A-Z]{4})(?P<major>[0-9a-f])(?P<minor>[0-9a-f])(?P<kind>[A-Z]{4})(?P<size>[0-9a-f]{6})_'
 Rever = re.compile(VEREX)  # compile is faster
+HEXCHARS = "0123456789abcdef"  # lowercase hex chars allowed in version string
+# shared immutable Versionage for each major minor hex char pair in version string
+Vrsns = {f"{major:x}{minor:x}": Versionage(major=major, minor=minor)
+            for major in range(16) for minor in range(16)}
+
+
+# cache of validated version string prefixes keyed by (proto, major, minor, kind)
+Vprefixes = {}
 
 
 def versify(proto=Protos.keri, version=Version, kind=Serials.json, size=0):
     """
     Returns version string
+    Caches the fixed proto, version, kind prefix so only size is formatted
     """
-    if proto not in Protos:
-        raise ValueError("Invalid message identifier = {}".format(proto))
-    #version = version if version else Version
-    if kind not in Serials:
-        raise ValueError("Invalid serialization kind = {}".format(kind))
+    key = (proto, version[0], version[1], kind)
+    prefix = Vprefixes.get(key)
+    if prefix is None:
+        if proto not in Protos:
+            raise ValueError("Invalid message identifier = {}".format(proto))
+        #version = version if version else Version
+        if kind not in Serials:
+            raise ValueError("Invalid serialization kind = {}".format(kind))
+        prefix = Vprefixes[key] = f"{proto}{version[0]:x}{version[1]:x}{kind}"
 
-    return VERFMT.format(proto, version[0], version[1], kind, size, VERRAWSIZE)
+    return f"{prefix}{size:0{VERRAWSIZE}x}_"
 
 
 def deversify(vs, version=None):
@@ -61,34 +74,76 @@ def deversify(vs, version=None):
       version (Versionage | None): supported version. None means do not check
             for supported version.
 
-    Uses regex match to extract:
+    Extracts from the fixed offsets of the version string without regex:
         protocol type
         protocol version tuple
         serialization kind
         serialization size
+    Accepts the same version strings as Rever.match.
     """
-    match = Rever.match(vs.encode("utf-8"))  # match takes bytes
-    if match:
-        proto, major, minor, kind, size = match.group("proto",
-                                                      "major",
-                                                      "minor",
-                                                      "kind",
-                                                      "size")
-        proto = proto.decode("utf-8")
-        vrsn = Versionage(major=int(major, 16), minor=int(minor, 16))
-        kind = kind.decode("utf-8")
+    # fixed offsets proto [0:4] major [4] minor [5] kind [6:10] size [10:16] '_'
+    # proto and kind are validated below by membership in Protos and Serials
+    vrsn = Vrsns.get(vs[4:6])  # major minor
+    if (len(vs) < VERFULLSIZE or vs[VERFULLSIZE - 1] != "_"
+            or vrsn is None or vs[10:16].strip(HEXCHARS)):
+        raise ValueError("Invalid version string = {}".format(vs))
+
+    proto = vs[:4]
+    kind = vs[6:10]
+
+    if proto not in Protos:
+        raise ValueError("Invalid message identifier = {}".format(proto))
+    if version is not None and vrsn != version:
+        raise ValueError(f"Expected version = {version}, got "
+                           f"{vrsn.major}.{vrsn.minor}.")
+    if kind not in Serials:
+        raise ValueError("Invalid serialization kind = {}".format(kind))
+    size = int(vs[10:16], 16)
+    return proto, vrsn, kind, size
 
-        if proto not in Protos:
-            raise ValueError("Invalid message identifier = {}".format(proto))
-        if version is not None and vrsn != version:
-            raise ValueError(f"Expected version = {version}, got "
-                               f"{vrsn.major}.{vrsn.minor}.")
-        if kind not in Serials:
-            raise ValueError("Invalid serialization kind = {}".format(kind))
-        size = int(size, 16)
-        return proto, vrsn, kind, size
 
-    raise ValueError("Invalid version string = {}".format(vs))
+# offsets of version string in raw field map serializations. JSON '{"v":"'
+# and MGPK or CBOR one byte map header, 'v' label and version string header
+VSOFFSETS = (6, 4)  # most common first
+
+
+def smell(raw, limit=12):
+    """
+    Returns:  tuple(proto, vrsn, kind, size, fore) or None Where:
+        proto (str): protocol type identifier
+        vrsn (Versionage): version tuple
+        kind (str): serialization kind
+        size  (int): raw size in bytes
+        fore (int): offset of version string in raw
+      None when no well formed version string at offset no greater than limit
+
+    Parameters:
+      raw (bytes | bytearray): serialization with embedded version string
+      limit (int): max offset of start of version string in raw
+
+    Tries the fixed offsets of the version string in JSON, MGPK, and CBOR
+    field maps first with deversify and only falls back to Rever regex search
+    when not found there. Fallback does not validate proto or kind values.
+    """
+    for fore in VSOFFSETS:
+        back = fore + VERFULLSIZE
+        if fore <= limit and raw[back - 1:back] == b'_':  # cheap pre check
+            try:
+                return (*deversify(raw[fore:back].decode("utf-8")), fore)
+            except ValueError:  # includes UnicodeDecodeError
+                pass
+
+    match = Rever.search(raw)  # Rever's regex takes bytes
+    if not match or match.start() > limit:
+        return None
+
+    proto, major, minor, kind, size = match.group("proto", "major", "minor",
+                                                  "kind", "size")
+    return (proto.decode("utf-8"),
+            Versionage(major=int(major, 16), minor=int(minor, 16)),
+            kind.decode("utf-8"),
+            int(size, 16),
+            match.start())
 
 """
 ilk is short for packet or message type for a given protocol
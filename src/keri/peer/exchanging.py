@@ -403,7 +403,7 @@ def serializeMessage(hby, said, pipelined=False):
     if len(cigars) > 0:
         atc.extend(coring.Counter(code=coring.CtrDex.NonTransReceiptCouples, count=len(cigars)).qb64b)
         for cigar in cigars:
-            if cigar.verfer.code not in coring.NonTransDex:
+            if cigar.verfer.code not in coring.NonTransSet:
                 raise ValueError("Attempt to use tranferable prefix={} for "
                                  "receipt.".format(cigar.verfer.qb64))
             atc.extend(cigar.verfer.qb64b)
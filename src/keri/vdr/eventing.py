@@ -73,7 +73,7 @@ def incept(
     if TraitDex.NoBackers in cnfg and len(baks) > 0:
         raise ValueError("{} backers specified for NB vcp, 0 allowed".format(len(baks)))
 
-    if len(oset(baks)) != len(baks):
+    if len(set(baks)) != len(baks):
         raise ValueError("Invalid baks = {}, has duplicates.".format(baks))
 
     if isinstance(toad, str):
@@ -496,11 +496,11 @@ def state(pre,
 
     cnfg = cnfg if cnfg is not None else []
 
-    if len(oset(br)) != len(br):  # duplicates in cuts
+    if len(set(br)) != len(br):  # duplicates in cuts
         raise ValueError("Invalid cuts = {} in latest est event, has duplicates"
                          ".".format(br))
 
-    if len(oset(ba)) != len(ba):  # duplicates in adds
+    if len(set(ba)) != len(ba):  # duplicates in adds
         raise ValueError("Invalid adds = {} in latest est event, has duplicates"
                          ".".format(ba))
 
@@ -856,7 +856,7 @@ class Tever:
         self.cuts = []  # always empty at inception since no prev event
         self.adds = []  # always empty at inception since no prev event
         baks = ked["b"]
-        if len(oset(baks)) != len(baks):
+        if len(set(baks)) != len(baks):
             raise ValidationError("Invalid baks = {}, has duplicates for evt = {}."
                                   "".format(baks, ked))
         self.baks = baks
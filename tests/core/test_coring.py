@@ -42,7 +42,7 @@ from keri.help import helping
 from keri.kering import (EmptyMaterialError, RawMaterialError, DerivationError,
                          ShortageError, InvalidCodeSizeError, InvalidVarIndexError,
                          InvalidValueError, DeserializeError)
-from keri.kering import Version, Versionage, VersionError
+from keri.kering import Version, Versionage, VersionError, smell
 from keri.kering import (ICP_LABELS, DIP_LABELS, ROT_LABELS, DRT_LABELS, IXN_LABELS,
                       KSN_LABELS, RPY_LABELS)
 from keri.kering import (VCP_LABELS, VRT_LABELS, ISS_LABELS, BIS_LABELS, REV_LABELS,
@@ -257,6 +257,9 @@ def test_b64_conversions():
     assert cs == b'BAA'
     i = b64ToInt(cs)
     assert i == 4096
+    assert b64ToInt(bytearray(cs)) == 4096
+    with pytest.raises(KeyError):  # bytes decoded by ordinal still rejects non Base64
+        b64ToInt(b'B=A')
 
     cs = intToB64(6011)
     assert cs == "Bd7"
@@ -340,6 +343,18 @@ def test_b64_conversions():
     assert not match
     assert match is None
 
+    # coring.decodeB64 matches base64 urlsafe decode
+    raw = bytes(range(256))
+    qb64b = encodeB64(raw)
+    assert b'-' in qb64b and b'_' in qb64b
+    assert coring.decodeB64(qb64b) == decodeB64(qb64b) == raw
+    assert coring.decodeB64(bytearray(qb64b)) == raw
+
+    # coring.encodeB64 matches base64 urlsafe encode including pad chars
+    assert coring.encodeB64(raw) == qb64b
+    assert coring.encodeB64(bytearray(raw)) == qb64b
+    assert coring.encodeB64(b'\xff') == encodeB64(b'\xff') == b'_w=='
+
     """End Test"""
 
 
@@ -477,6 +492,11 @@ def test_matter():
     for ckey in Matter.Sizes.keys():
         assert Matter.Hards[ckey[0]] == Matter.Sizes[ckey].hs
 
+    # verify each code in codex is unique and has exactly one Sizes entry
+    codes = dataclasses.astuple(MtrDex)
+    assert len(codes) == len(set(codes)) == len(Matter.Sizes)
+    assert set(codes) == set(Matter.Sizes)
+
     #  verify all Codes have ss == 0 and not fs % 4 and hs > 0 and fs > hs
     #  if fs is not None else not (hs + ss) % 4
     for val in Matter.Sizes.values():
@@ -491,6 +511,28 @@ def test_matter():
         ckey = codeB64ToB2(skey)
         assert Matter.Bards[ckey] == sval
 
+    # frozensets of codex values for fast membership
+    assert coring.NonTransSet == frozenset(coring.NonTransDex)
+    assert coring.DigSet == frozenset(coring.DigDex)
+    assert coring.PreSet == frozenset(coring.PreDex)
+    assert coring.NumSet == frozenset(NumDex)
+    assert coring.BexSet == frozenset(coring.BexDex)
+    assert coring.SmallVrzLeads == ('4', '5', '6')
+    assert coring.LargeVrzLeads == ('7', '8', '9')
+
+    # Bodes maps each fixed size code to its binary code bytes
+    for ckey, cval in Matter.Sizes.items():
+        if cval.fs:
+            assert Matter.Bodes[ckey] == codeB64ToB2(ckey)
+        else:
+            assert ckey not in Matter.Bodes
+
+    # Selects maps both char and its ordinal of first character of code to hard size
+    for skey, sval in Matter.Hards.items():
+        assert Matter.Selects[skey] == sval
+        assert Matter.Selects[ord(skey)] == sval
+    assert len(Matter.Selects) == 2 * len(Matter.Hards)
+
     assert Matter._rawSize(MtrDex.Ed25519) == 32
     assert Matter._leadSize(MtrDex.Ed25519) == 0
 
@@ -539,6 +581,33 @@ def test_matter():
     assert matter.code == MtrDex.Ed25519N
     assert matter.raw == verkey
 
+    # qb64b is cached so repeated access does not reencode
+    assert matter.qb64b == prefixb
+    assert matter.qb64b is matter.qb64b
+    matter = Matter(raw=verkey, code=MtrDex.Ed25519N)
+    assert matter._qb64b is None
+    assert matter.qb64b == prefixb
+    assert matter.qb64b is matter.qb64b
+    matter = Matter(qb64b=bytearray(prefixb))
+    assert matter._qb64b is None  # mutable input not cached
+    assert matter.qb64b == prefixb
+    # non URL safe std alphabet input still decodes but qb64 is canonical
+    diger = Matter(raw=b'\xff' * 32, code=MtrDex.Blake3_256)
+    alt = diger.qb64.replace('_', '/')
+    assert alt != diger.qb64
+    matter = Matter(qb64=alt)
+    assert matter._qb64b is None
+    assert matter.raw == diger.raw
+    assert matter.qb64 == diger.qb64
+    assert not hasattr(matter, "__dict__")  # uses __slots__
+
+    # exact sized bytes raw is not copied, bytearray raw is copied to bytes
+    matter = Matter(raw=verkey, code=MtrDex.Ed25519N)
+    assert matter.raw is verkey
+    matter = Matter(raw=bytearray(verkey + b'abc'), code=MtrDex.Ed25519N)
+    assert isinstance(matter.raw, bytes)
+    assert matter.raw == verkey
+
     # Test from qb64b as str
     matter = Matter(qb64b=prefix)
     assert matter.code == MtrDex.Ed25519N
@@ -1787,6 +1856,10 @@ def test_indexer():
     assert IdxBthSigDex.ECDSA_256r1_Big_Sig == '2E'
     assert IdxBthSigDex.Ed448_Big_Sig == '3A'
 
+    # frozensets of codex values for fast membership
+    assert coring.IdxSigSet == frozenset(coring.IdxSigDex)
+    assert coring.IdxCrtSigSet == frozenset(IdxCrtSigDex)
+    assert coring.IdxBthSigSet == frozenset(IdxBthSigDex)
 
     # first character of code with hard size of code
     assert Indexer.Hards == {
@@ -1832,6 +1905,11 @@ def test_indexer():
     for ckey in Indexer.Sizes.keys():
         assert Indexer.Hards[ckey[0]] == Indexer.Sizes[ckey].hs
 
+    # verify each code in codex is unique and has exactly one Sizes entry
+    codes = dataclasses.astuple(IdrDex)
+    assert len(codes) == len(set(codes)) == len(Indexer.Sizes)
+    assert set(codes) == set(Indexer.Sizes)
+
     # verify all Codes have hs > 0 and ss > 0 and fs >= hs + ss if fs is not None
     # verify os is part of ss
     for val in Indexer.Sizes.values():
@@ -1849,6 +1927,12 @@ def test_indexer():
         ckey = codeB64ToB2(skey)
         assert Indexer.Bards[ckey] == sval
 
+    # Selects maps both char and its ordinal of first character of code to hard size
+    for skey, sval in Indexer.Hards.items():
+        assert Indexer.Selects[skey] == sval
+        assert Indexer.Selects[ord(skey)] == sval
+    assert len(Indexer.Selects) == 2 * len(Indexer.Hards)
+
     with pytest.raises(EmptyMaterialError):
         indexer = Indexer()
 
@@ -2441,6 +2525,11 @@ def test_counter():
     for ckey in Counter.Sizes.keys():
         assert Counter.Hards[ckey[:2]] == Counter.Sizes[ckey].hs
 
+    # verify each code in codex is unique and has exactly one Sizes entry
+    codes = dataclasses.astuple(CtrDex)
+    assert len(codes) == len(set(codes)) == len(Counter.Sizes)
+    assert set(codes) == set(Counter.Sizes)
+
     #  verify all Codes have hs > 0 and ss > 0 and fs = hs + ss and not fs % 4
     for val in Counter.Sizes.values():
         assert val.hs > 0 and val.ss > 0 and val.hs + val.ss == val.fs and not val.fs % 4
@@ -2738,6 +2827,13 @@ def test_counter():
     with pytest.raises(ValueError):
         Counter.semVerToB64(patch=-1)
 
+    # qb2 matches Base64 decode of qb64b for every code and count extremes
+    for code, sizage in Counter.Sizes.items():
+        for count in (0, 1, 64 ** sizage.ss - 1):
+            counter = Counter(code=code, count=count)
+            assert counter.qb2 == decodeB64(counter.qb64b)
+            assert Counter(qb2=counter.qb2).count == count
+
     """ Done Test """
 
 
@@ -2747,6 +2843,8 @@ def test_seqner():
     """
     Test Seqner sequence number subclass of CryMat
     """
+    assert Seqner.Rize == Matter._rawSize(MtrDex.Salt_128) == 16
+
     number = Seqner()  # defaults to zero
     assert number.raw == b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
     assert number.code == MtrDex.Salt_128
@@ -2909,6 +3007,9 @@ def test_number():
     with pytest.raises(RawMaterialError):
         number = Number(raw=b'')
 
+    assert Number.Rizes == {NumDex.Short: 2, NumDex.Long: 4, NumDex.Big: 8,
+                            NumDex.Huge: 16}
+
     number = Number()  # test None defaults to zero
     assert number.code == NumDex.Short
     assert number.raw == b'\x00\x00'
@@ -3959,6 +4060,19 @@ def test_signer():
     with pytest.raises(ValueError):  # use invalid code not SEED type code
         signer = Signer(code=MtrDex.Ed25519N)
 
+    # key-pair derived lazily on first use of .verfer or .sign
+    signer = Signer()
+    assert signer._verfer is None and signer._sigkey is None
+    verfer = signer.verfer
+    assert signer._sigkey is not None
+    assert signer.verfer is verfer  # cached
+    assert set(Signer.Suites) == {MtrDex.Ed25519_Seed, MtrDex.ECDSA_256r1_Seed,
+                                  MtrDex.ECDSA_256k1_Seed}
+    signer = Signer(raw=signer.raw)
+    cigar = signer.sign(ser)  # sign derives before verfer accessed
+    assert signer._verfer is not None
+    assert verfer.verify(cigar.raw, ser)
+
     # Non transferable defaults
     signer = Signer(transferable=False)  # Ed25519N verifier
     assert signer.code == MtrDex.Ed25519_Seed
@@ -4578,7 +4692,7 @@ def test_salter():
     """ Done Test """
 
 
-def test_generatesigners():
+def test_generatesigners(monkeypatch):
     """
     Test the support function genSigners
 
@@ -4603,6 +4717,13 @@ def test_generatesigners():
                        'AHMBU5PsIJN2U9m7j0SGyvs8YD8fkym2noELzxIrzfdG',
                        'AJZ7ZLd7unQ4IkMUwE69NXcvDO9rrmmRH_Xk3TPu9BpP']
 
+    # concurrent stretching keeps same order and seeds as sequential
+    monkeypatch.setattr(coring, "cpu_count", lambda: 4)
+    signers = generateSigners(salt=salt, count=4)
+    assert [signer.qb64 for signer in signers] == sigkeys
+    signers = generateSigners(salt=salt, count=4, workers=1)  # serial
+    assert [signer.qb64 for signer in signers] == sigkeys
+
     secrets = generatePrivates(salt=salt, count=4)
     assert secrets == sigkeys
 
@@ -4642,6 +4763,18 @@ def test_diger():
     assert len(diger.raw) == Matter._rawSize(diger.code)
     assert diger.verify(ser=ser)
     assert diger.qb64b == b'ELC5L3iBVD77d_MYbYGGCUQgqQBju1o4x1Ud-z2sL-ux'
+
+    # Digests table covers each supported digest code
+    assert set(Diger.Digests) == {MtrDex.Blake3_256, MtrDex.Blake2b_256,
+                                  MtrDex.Blake2s_256, MtrDex.SHA3_256,
+                                  MtrDex.SHA2_256}
+    assert Diger.Digests[MtrDex.SHA2_256](ser) == hashlib.sha256(ser).digest()
+    for code in Diger.Digests:
+        diger = Diger(ser=ser, code=code)
+        assert diger.code == code
+        assert diger.raw == Diger.Digests[code](ser)
+        assert diger.verify(ser=ser)
+    assert not hasattr(diger, "__dict__")  # uses __slots__
     #b'EsLkveIFUPvt38xhtgYYJRCCpAGO7WjjHVR37Pawv67E'
 
     digb = b'ELC5L3iBVD77d_MYbYGGCUQgqQBju1o4x1Ud-z2sL-ux'
@@ -4754,6 +4887,11 @@ def test_prefixer():
     assert nxtfer.qb64 == 'DKZfiTRK8jVUwYMjBphMpu8as2jqQTp4J9oEiLLEX_YA'
     #'Dpl-JNEryNVTBgyMGmEym7xqzaOpBOngn2gSIssRf9gA'
 
+    # each supported code has both derive and verify method
+    assert set(Prefixer.Derivers) == set(Prefixer.Verifiers)
+    for name in list(Prefixer.Derivers.values()) + list(Prefixer.Verifiers.values()):
+        assert callable(getattr(Prefixer, name))
+
     with pytest.raises(EmptyMaterialError):
         prefixer = Prefixer()
 
@@ -5484,6 +5622,7 @@ def test_saider():
 
     saider1 = Saider(sad=sad, ignore=["read"])
     assert saider1.qb64 == 'EBam6rzvfq0yF6eI7Czrg3dUVhqg2cwNkSoJvyHWPj3p'
+    assert sad == dict(d="", first="John", last="Doe", read=False)  # not clobbered
 
     saider2, sad2 = Saider.saidify(sad=sad, ignore=["read"])
     assert saider2.qb64 == saider1.qb64
@@ -5685,6 +5824,41 @@ def test_versify():
     assert kind == Serials.cbor
     assert version == Version
     assert size == 65
+
+    vs = versify(proto=Protos.acdc, version=Versionage(major=1, minor=1),
+                 kind=Serials.cbor, size=0xabcdef)
+    assert vs == "ACDC11CBORabcdef_"
+    with pytest.raises(ValueError):
+        versify(proto="ABCD")
+    with pytest.raises(ValueError):
+        versify(kind="ABCD")
+
+    # trailing chars after version string are ignored like Rever.match
+    proto, version, kind, size = deversify("KERI10JSON00012b_extra")
+    assert (proto, version, kind, size) == (Protos.keri, Version, Serials.json, 299)
+
+    for vs in ("KERI10JSON00012b", "KERI10JSON00012B_", "KERI1xJSON00012b_",
+               "KERI10JSON0+012b_", "KERI10JSON 0012b_", "keri10JSON00012b_",
+               "KERI10json00012b_", "KERI10XXXX00012b_", "ABCD10JSON00012b_"):
+        with pytest.raises(ValueError):
+            deversify(vs)
+
+    with pytest.raises(ValueError):
+        deversify("KERI10JSON000000_", version=Versionage(major=2, minor=0))
+
+    # smell finds version string at fixed offsets else falls back to regex
+    raw = b'{"v":"KERI10JSON00002a_","t":"icp"}'
+    assert smell(raw) == (Protos.keri, Version, Serials.json, 42, 6)
+    raw = b'\x82\xa1v\xb1KERI10MGPK00002a_\xa1t\xa3icp'
+    assert smell(raw) == (Protos.keri, Version, Serials.mgpk, 42, 4)
+    raw = b'{"v" : "ACDC11JSON00002a_"}'  # not at fixed offset
+    assert smell(raw) == (Protos.acdc, Versionage(major=1, minor=1),
+                          Serials.json, 42, 8)
+    raw = b'{"v":"ABCD10WXYZ00002a_"}'  # regex fallback does not validate
+    assert smell(raw) == ("ABCD", Version, "WXYZ", 42, 6)
+    assert smell(b'{"v":"KERI10JSON00002a_"}', limit=4) is None
+    assert smell(b'{"v":"KERI10JSON00002A_"}') is None
+    assert smell(b'{"v":"KERI10JSON00002a"}') is None
     """End Test"""
 
 
@@ -5992,6 +6166,17 @@ def test_serder():
     proto, version, knd, size = deversify(evt2.ked["v"])
     assert proto == Protos.keri
     assert knd == Serials.json
+    raw = evt2.raw
+    evt2.kind = Serials.json  # unchanged kind does not reserialize
+    assert evt2.raw is raw
+    ked = evt2.ked
+    ked["i"] = "HIJKLMN"  # in place edit not seen by unchanged kind
+    evt2.kind = Serials.json
+    assert evt2.raw is raw
+    evt2.ked = ked  # ked setter reserializes in place edits
+    assert evt2.raw != raw
+    assert b'"i":"HIJKLMN"' in evt2.raw
+    assert evt2.size == len(evt2.raw)
 
     #  Test diger code
     ked = {'v': "KERI10JSON00006a_",
@@ -6156,10 +6341,12 @@ def test_tholder():
     assert tholder.satisfy(indices=list(range(tholder.thold)))
 
     tholder = Tholder(sith=f'{15:x}')
+    assert tholder._limen is None  # limen computed lazily on first access
     assert not tholder.weighted
     assert tholder.size == tholder.thold
     assert tholder.thold == 15
     assert tholder.limen == b'MAAP'
+    assert tholder.limen is tholder.limen  # cached
     assert tholder.sith == "f"
     assert tholder.json == '"f"'
     assert tholder.num == 15
@@ -6292,6 +6479,13 @@ def test_tholder():
     assert tholder.satisfy(indices=[0, 0, 1, 2, 1])
     assert not tholder.satisfy(indices=[0, 2])
     assert not tholder.satisfy(indices=[2, 3, 4])
+    assert tholder._wholds == [(4, [2, 2, 1, 1, 1])]  # int weights over lcd
+    assert Tholder.weight("1/4") is tholder.thold[0][2]  # cached weight
+    assert Tholder.weight("1/4") == Fraction(1, 4)
+    # non str not cached so 1.0, True, 1 which hash same parse independently
+    assert Tholder.weight(1.0) == 1 and type(Tholder.weight(1.0)) is int
+    assert Tholder.weight(True) == 1 and type(Tholder.weight(True)) is int
+    assert Tholder.weight("1") == 1 and type(Tholder.weight("1")) is int
 
     tholder = Tholder(sith=["1/2", "1/2", "1/4", "1/4", "1/4", "0"])
     assert tholder.weighted
@@ -15,7 +15,7 @@ import pytest
 from keri import kering
 from keri.kering import Versionage
 
-from keri.core import coring
+from keri.core import coring, serdering
 
 from keri.core.serdering import (Fieldage, Serdery, Serder,
                                  SerderKERI, SerderACDC, )
@@ -745,6 +745,20 @@ def test_serderkeri_icp():
     assert serder.fner == None
     assert serder.fn == None
 
+    # parsed primitives are cached but returned lists are copies
+    assert serder.sner is serder.sner
+    assert serder.verfers is not serder.verfers
+    assert serder.verfers == serder.verfers
+    assert serder.ndigers is not serder.ndigers
+
+    # makify reassigns ._sad so resets caches
+    sner = serder.sner
+    msad = dict(serder.sad)
+    msad['s'] = '1'
+    serder.makify(sad=msad)
+    assert serder.sn == 1
+    assert serder.sner is not sner
+
     serder = SerderKERI(raw=raw)
     assert serder.raw == raw
     assert serder.sad == sad
@@ -2267,6 +2281,12 @@ def test_serdery():
 
     assert ims == bytearray(b'Not a Serder here or there or anywhere.')
 
+    # smell of version string is cached by head of raw
+    hits = serdering._smell.cache_info().hits
+    serder = SerderKERI(raw=serderKeri.raw)
+    assert serder.raw == serderKeri.raw
+    assert serdering._smell.cache_info().hits == hits + 1
+
     """End Test"""
 
 if __name__ == "__main__":